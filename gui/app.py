@@ -3,13 +3,18 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from pathlib import Path
 import logging
-from datetime import datetime
+import re
+import threading
+import time
 from .utils.session import load_session, save_session
 from .tabs import (
     MainEntryTab,
     IbisViewerTab, PlotsTab, CorrelationTab
 )
 
+_SUCCESS_RE = re.compile("success", re.IGNORECASE)
+
+
 class S2IBISpyGUI:
     VERSION = "2.1.0"
 
@@ -87,6 +92,13 @@ class S2IBISpyGUI:
         self.notebook.add(self.plots_tab.frame, text="  📊 Plots  ")
         self.notebook.add(self.corr_tab.frame, text="  🔬 Correlation  ")
 
+        # Plots/Correlation build their widgets the first time they are shown
+        self._tab_builders = {
+            str(self.plots_tab.frame): self.plots_tab.ensure_built,
+            str(self.corr_tab.frame): self.corr_tab.ensure_built,
+        }
+        self.notebook.bind("<<NotebookTabChanged>>", self._lazy_build)
+
         # 5. NOW CREATE MENU — AFTER ALL TABS EXIST!
         menubar = tk.Menu(self.root)
         self.root.config(menu=menubar)
@@ -160,27 +172,61 @@ class S2IBISpyGUI:
         self.log_text.tag_config("SUCCESS", foreground="#88ffff", font=("Consolas", 10, "bold"))
 
         class LogHandler(logging.Handler):
+            """Queue records and flush them to the log widget in one insert per 50 ms."""
+            FLUSH_MS = 50
+
             def __init__(self, text_widget):
                 super().__init__()
                 self.text_widget = text_widget  # ← Save reference
+                self._pending = []
+                self._scheduled = False
+                self._pending_lock = threading.Lock()
 
             def emit(self, record):
                 msg = self.format(record)
                 tag = "INFO"
                 if record.levelno >= logging.ERROR: tag = "ERROR"
                 elif record.levelno >= logging.WARNING: tag = "WARNING"
-                elif "success" in msg.lower(): tag = "SUCCESS"
+                elif _SUCCESS_RE.search(msg): tag = "SUCCESS"
+
+                # record.created is the record's own time; no extra clock read/datetime
+                stamp = time.strftime("%H:%M:%S", time.localtime(record.created))
+                with self._pending_lock:
+                    self._pending.append((f"[{stamp}] {msg}\n", tag))
+                    if self._scheduled:
+                        return
+                    self._scheduled = True
+                try:
+                    self.text_widget.after(self.FLUSH_MS, self._flush)  # ← Thread-safe
+                except Exception:
+                    # No flush is pending, so let the next record try to schedule one
+                    with self._pending_lock:
+                        self._scheduled = False
+                    self.handleError(record)
 
-                def update():
-                    self.text_widget.insert(tk.END, f"[{datetime.now():%H:%M:%S}] {msg}\n", tag)
-                    self.text_widget.see(tk.END)
-                self.text_widget.after(0, update)  # ← Thread-safe
+            def _flush(self):
+                with self._pending_lock:
+                    pending, self._pending = self._pending, []
+                    self._scheduled = False
+                if not pending:
+                    return
+                # Text.insert takes (chars, tags) pairs, so the whole batch is one Tcl call
+                args = []
+                for line, tag in pending:
+                    args.extend((line, tag))
+                self.text_widget.insert(tk.END, *args)
+                self.text_widget.see(tk.END)
 
         handler = LogHandler(self.log_text)
         handler.setFormatter(logging.Formatter("%(levelname)s → %(message)s"))
         logging.getLogger().addHandler(handler)
         logging.getLogger().setLevel(logging.INFO)
 
+    def _lazy_build(self, event=None):
+        builder = self._tab_builders.pop(self.notebook.select(), None)
+        if builder:
+            builder()
+
     def log(self, msg, level="INFO"):
         logging.log(getattr(logging, level), msg)
 
@@ -201,11 +247,8 @@ class S2IBISpyGUI:
 
         # Load into IBIS Viewer
         try:
-            with open(ibs_path, "r", encoding="utf-8") as f:
-                content = f.read()
-            self.viewer_tab.text.delete(1.0, tk.END)
-            self.viewer_tab.text.insert(tk.END, content)
-            self.viewer_tab.parse_sections(content)
+            content, rows = self.viewer_tab.read_ibs(ibs_path)
+            self.viewer_tab.show_ibs(content, rows)
             self.notebook.select(self.viewer_tab.frame)
             self.log(f"IBIS loaded: {ibs_path.name}", "INFO")
         except Exception as e:
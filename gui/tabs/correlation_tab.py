@@ -4,8 +4,6 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 
 
 class CorrelationTab:
@@ -18,9 +16,14 @@ class CorrelationTab:
         self.ax = None
         self.canvas = None
         self.popouts = []
+        self._built = False
 
-        self.build_ui()
-        self.frame.bind("<Visibility>", lambda e: self.load_latest_results())
+    def ensure_built(self):
+        # Widgets are created on first use (tab selected or file loaded)
+        if not self._built:
+            self._built = True
+            self.build_ui()
+            self.frame.bind("<Visibility>", lambda e: self.load_latest_results())
 
     def build_ui(self):
         main = ttk.PanedWindow(self.frame, orient=tk.VERTICAL)
@@ -124,6 +127,7 @@ class CorrelationTab:
 
     # === Data Loading ===
     def load_latest_results(self):
+        self.ensure_built()
         outdir_str = self.gui.main_tab.outdir
         if not outdir_str or not outdir_str.strip():
             self.gui.log("Output directory not set. Please set it in Input/Config tab.", "WARNING")
@@ -151,6 +155,7 @@ class CorrelationTab:
 
     def load_tr0(self, path: Path):
         from gui.utils.tr0_reader import parse_tr0_file
+        self.ensure_built()
         try:
             self.waveforms = parse_tr0_file(path)
             self.refresh_tree()
@@ -200,6 +205,8 @@ class CorrelationTab:
     def ensure_canvas(self):
         if self.canvas:
             return
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
         plt.style.use('dark_background')
         self.fig = plt.Figure(figsize=(10, 6), facecolor="#1e1e1e")
         self.ax = self.fig.add_subplot(111)
@@ -249,6 +256,8 @@ class CorrelationTab:
         window.title("Correlation — Full View")
         window.geometry("1600x1000")
 
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
         fig = plt.Figure(figsize=(14, 9), facecolor="#1e1e1e")
         ax = fig.add_subplot(111)
         ax.set_facecolor("#1e1e1e")
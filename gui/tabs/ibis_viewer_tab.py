@@ -4,6 +4,11 @@ from tkinter import ttk, scrolledtext, filedialog
 from pathlib import Path
 import re
 
+_SECTION_HEADER_RE = re.compile(r"\[(.+?)\](.*)")
+_FIXTURE_KEYS = frozenset({"v_fixture", "v_fixture_min", "v_fixture_max", "r_fixture", "c_fixture"})
+_INSERT_CHUNK = 1 << 16
+
+
 class IbisViewerTab:
     def __init__(self, notebook, gui):
         self.gui = gui
@@ -35,16 +40,17 @@ class IbisViewerTab:
 
         self.tree.bind("<Double-1>", self.jump_to_section)
 
+        # (path, mtime_ns, size, content, section rows) of the last file read; only that
+        # one file is kept, and it is reused while the file is unchanged
+        self._ibs_cache: tuple[str, int, int, str, list] | None = None
+
     def load_ibs(self, path):
         p = Path(path)
         if not p.exists():
             self.gui.log(f"IBIS file not found: {p}", "ERROR")
             return
-        with open(p, "r", encoding="utf-8", errors="ignore") as f:
-            content = f.read()
-        self.text.delete(1.0, tk.END)
-        self.text.insert(tk.END, content)
-        self.parse_sections(content)
+        content, rows = self.read_ibs(p)
+        self.show_ibs(content, rows)
         self.path_var.set(str(p))
         # Also feed Plots tab if available
         try:
@@ -60,14 +66,47 @@ class IbisViewerTab:
         if file_path:
             self.load_ibs(file_path)
 
+    def read_ibs(self, path):
+        """Return (content, section rows) for an .ibs file, re-reading only if it changed."""
+        p = Path(path)
+        st = p.stat()
+        key = str(p.resolve())
+        cached = self._ibs_cache
+        if cached and cached[:3] == (key, st.st_mtime_ns, st.st_size):
+            return cached[3], cached[4]
+        with open(p, "r", encoding="utf-8", errors="ignore") as f:
+            content = f.read()
+        rows = self._section_rows(content)
+        self._ibs_cache = (key, st.st_mtime_ns, st.st_size, content, rows)
+        return content, rows
+
+    def show_ibs(self, content, rows):
+        self.text.delete(1.0, tk.END)
+        # Large files go in as 64 KiB slices so Tk can repaint between Tcl calls
+        for off in range(0, len(content), _INSERT_CHUNK):
+            self.text.insert(tk.END, content[off:off + _INSERT_CHUNK])
+            if len(content) > _INSERT_CHUNK:
+                self.text.update_idletasks()
+        self._fill_sections(rows)
+
     def parse_sections(self, content):
+        self._fill_sections(self._section_rows(content))
+
+    def _fill_sections(self, rows):
         self.tree.delete(*self.tree.get_children())
+        for display_text, line_no in rows:
+            self.tree.insert("", "end", text=display_text, values=(line_no,))  # store line number
+
+    @staticmethod
+    def _section_rows(content):
+        """(display text, line number) for every [Section] header in content."""
+        rows = []
         lines = content.splitlines()
         i = 0
         while i < len(lines):
             line = lines[i].strip()
             if line.startswith("[") and "]" in line:
-                header_match = re.match(r"\[(.+?)\](.*)", line)
+                header_match = _SECTION_HEADER_RE.match(line)
                 if not header_match:
                     i += 1
                     continue
@@ -85,7 +124,7 @@ class IbisViewerTab:
                         key, val = param_line.split("=", 1)
                         key = key.strip().lower()
                         val = val.strip()
-                        if key in {"v_fixture", "v_fixture_min", "v_fixture_max", "r_fixture", "c_fixture"}:
+                        if key in _FIXTURE_KEYS:
                             fixtures[key] = val
                     j += 1
 
@@ -102,9 +141,9 @@ class IbisViewerTab:
                     if tail:
                         display_parts.append(tail)
 
-                display_text = " ".join(display_parts)
-                self.tree.insert("", "end", text=display_text, values=(i,))  # store line number
+                rows.append((" ".join(display_parts), i))
             i += 1
+        return rows
 
     def jump_to_section(self, event=None):
         sel = self.tree.selection()
@@ -121,13 +160,14 @@ class IbisViewerTab:
         except (ValueError, IndexError):
             return
 
-        # Get full content once
-        content = self.text.get("1.0", "end")
-        lines = content.splitlines()
+        # Query single lines and the line count from Tk instead of copying the
+        # whole buffer out of the widget on every double-click
+        def line_text(idx):  # 0-based, like the stored section line numbers
+            return self.text.get(f"{idx + 1}.0", f"{idx + 1}.end")
 
         # Find the actual [Section] line (skip blank lines/comments above)
         actual_line = line_num
-        while actual_line > 0 and not lines[actual_line].lstrip().startswith("["):
+        while actual_line > 0 and not line_text(actual_line).lstrip().startswith("["):
             actual_line -= 1
 
         target_line = actual_line + 1  # Tkinter is 1-indexed
@@ -138,7 +178,8 @@ class IbisViewerTab:
 
         # Highlight section
         self.text.tag_remove("sel", "1.0", "end")
-        end_line = min(target_line + 15, len(lines))
+        n_lines = int(self.text.index("end-1c").split(".")[0])
+        end_line = min(target_line + 15, n_lines)
         self.text.tag_add("sel", target, f"{end_line}.0")
 
         # Beautiful highlight
@@ -19,7 +19,7 @@ if str(root_path) not in sys.path:
 from gui.utils.yaml_editor_model import YamlModel, ValidationError
 from gui.utils.yaml_editor_config import UI_SCHEMA, COLORS, FONTS
 from s2ibispy.s2i_to_yaml import convert_s2i_to_yaml
-from legacy.parser import S2IParser
+from s2ibispy.legacy.parser import S2IParser
 from s2ibispy.cli import main as run_conversion
 
 try:
@@ -579,20 +579,37 @@ class MainEntryTab:
             # Populate UI
             self._populate_ui_from_model()
             
-            # Also parse for legacy compatibility
-            try:
-                parser = S2IParser()
-                ibis, global_, mList = parser.parse(str(path))
-                self.gui.ibis = ibis
-                self.gui.global_ = global_
-                self.gui.mList = mList
-            except Exception as e:
-                self.gui.log(f"Legacy parser warning: {e}", "WARNING")
+            # Also parse for legacy compatibility (off the Tk thread)
+            self._start_legacy_parse(str(path))
         
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load .s2i:\n{e}")
             self.gui.log(f"S2I load error: {e}", "ERROR")
 
+    def _start_legacy_parse(self, path: str):
+        """Run S2IParser on a daemon thread; results are applied on the Tk thread."""
+        self._legacy_parse_path = path
+
+        def thread_target():
+            try:
+                result, err = S2IParser().parse(path), None
+            except Exception as e:
+                result, err = None, e
+            self.gui.root.after(0, self._legacy_parse_done, path, result, err)
+
+        threading.Thread(target=thread_target, daemon=True).start()
+
+    def _legacy_parse_done(self, path: str, result, err):
+        if path != getattr(self, "_legacy_parse_path", None):
+            return  # a newer file was loaded meanwhile
+        if err is not None:
+            self.gui.log(f"Legacy parser warning: {err}", "WARNING")
+            return
+        ibis, global_, mList = result
+        self.gui.ibis = ibis
+        self.gui.global_ = global_
+        self.gui.mList = mList
+
     def new_file(self):
         """Create a new blank YAML file."""
         if self.yaml_modified and not messagebox.askyesno("Unsaved changes", "Discard changes?"):
@@ -843,17 +860,21 @@ class MainEntryTab:
             widget.delete(0, tk.END)
             widget.insert(0, str(value) if value is not None and value != "" else "")
         
-        # Models
-        for item in self.models_tree.get_children():
-            self.models_tree.delete(item)
-        for m in self.yaml_model.get_models():
-            self.models_tree.insert("", "end", values=(
+        # Models: build every row first; rebuild the tree only if it differs
+        model_rows = [
+            (
                 m.get("name", ""),
                 m.get("type", "I/O"),
                 m.get("enable", ""),
                 m.get("polarity", ""),
                 "Yes" if m.get("nomodel", False) else ""
-            ))
+            )
+            for m in self.yaml_model.get_models()
+        ]
+        if not self._tree_matches(self.models_tree, model_rows):
+            self.models_tree.delete(*self.models_tree.get_children())
+            for row in model_rows:
+                self.models_tree.insert("", "end", values=row)
         
         # Load spice_type into simulation options
         if hasattr(self, 'spice_type_var'):
@@ -861,16 +882,34 @@ class MainEntryTab:
             self.spice_type_var.set(spice_type)
         
         # Pins
-        for item in self.pins_tree.get_children():
-            self.pins_tree.delete(item)
-        for p in self.yaml_model.get_pins():
-            self.pins_tree.insert("", "end", values=(
+        pin_rows = [
+            (
                 p.get("pinName", ""),
                 p.get("signalName", ""),
                 p.get("modelName", ""),
                 p.get("inputPin", ""),
                 p.get("enablePin", "")
-            ))
+            )
+            for p in self.yaml_model.get_pins()
+        ]
+        if not self._tree_matches(self.pins_tree, pin_rows):
+            self.pins_tree.delete(*self.pins_tree.get_children())
+            for row in pin_rows:
+                self.pins_tree.insert("", "end", values=row)
+
+    @staticmethod
+    def _tree_matches(tree, rows) -> bool:
+        """True if the tree already shows exactly these rows (reloads of an unchanged file)."""
+        children = tree.get_children()
+        if len(children) != len(rows):
+            return False
+        tk_, path = tree.tk, str(tree)
+        for iid, row in zip(children, rows):
+            # Raw Tcl strings: item(iid, "values") would coerce numeric-looking cells
+            shown = tk_.splitlist(tk_.call(path, "item", iid, "-values"))
+            if tuple(map(str, shown)) != tuple(map(str, row)):
+                return False
+        return True
 
     def _flatten_yaml_data(self, data: dict) -> dict:
         """Flatten nested YAML structures for UI display."""
@@ -2,7 +2,27 @@
 import tkinter as tk
 from tkinter import ttk
 
+
+def _fmt_typ(tmm, spec):
+    """Format tmm.typ with spec, or "NA" when the value is missing or not numeric."""
+    try:
+        return format(tmm.typ, spec)
+    except (AttributeError, TypeError, ValueError):
+        return "NA"
+
+
 class ModelsTab:
+    _MODEL_TYPE_NAMES = {
+        1: "Input", 2: "Output", 3: "I/O", 4: "Series", 5: "Series_switch",
+        6: "Terminator", 7: "I/O_Open_drain", 8: "I/O_Open_sink",
+        9: "Open_drain", 10: "Open_sink", 11: "Open_source",
+        12: "I/O_Open_source", 13: "Output_ECL", 14: "I/O_ECL", 16: "3-state",
+    }
+    # Normalised spelling (lower-case, "/" and "-" → "_") → official name
+    _MODEL_TYPE_BY_KEY = {
+        v.lower().replace("/", "_").replace("-", "_"): v for v in _MODEL_TYPE_NAMES.values()
+    }
+
     def __init__(self, notebook, gui):
         self.gui = gui
         self.frame = ttk.Frame(notebook)
@@ -19,8 +39,7 @@ class ModelsTab:
         self.tree.pack(fill="both", expand=True, padx=10, pady=10)
 
     def populate(self, models):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        rows = []
         for m in models:
             mt_str = getattr(m, "modelType", None)
             if mt_str is None: continue
@@ -29,25 +48,22 @@ class ModelsTab:
             if m.modelName.upper() in {"POWER", "GND", "VCC", "VDD", "VSS"}:
                 continue
 
-            self.tree.insert("", "end", values=(
+            rows.append((
                 m.modelName,
                 self._model_type_str(mt_str),
-                f"{getattr(m.Vinl, 'typ', 'NA'):.3f}",
-                f"{getattr(m.Vinh, 'typ', 'NA'):.3f}",
-                f"{getattr(m.c_comp, 'typ', 'NA'):.4f}"
+                _fmt_typ(getattr(m, "Vinl", None), ".3f"),
+                _fmt_typ(getattr(m, "Vinh", None), ".3f"),
+                _fmt_typ(getattr(m, "c_comp", None), ".4f")
             ))
 
+        self.tree.delete(*self.tree.get_children())
+        for row in rows:
+            self.tree.insert("", "end", values=row)
+
     def _model_type_str(self, mt):
-        mapping = {
-            1: "Input", 2: "Output", 3: "I/O", 4: "Series", 5: "Series_switch",
-            6: "Terminator", 7: "I/O_Open_drain", 8: "I/O_Open_sink",
-            9: "Open_drain", 10: "Open_sink", 11: "Open_source",
-            12: "I/O_Open_source", 13: "Output_ECL", 14: "I/O_ECL", 16: "3-state",
-        }
         if isinstance(mt, (int, float)):
-            return mapping.get(int(mt), f"Unknown({int(mt)})")
+            return self._MODEL_TYPE_NAMES.get(int(mt), f"Unknown({int(mt)})")
         if isinstance(mt, str):
             s = mt.strip().lower()
-            rev_map = {v.lower().replace("/", "_").replace("-", "_"): v for k, v in mapping.items() if isinstance(k, int)}
-            return rev_map.get(s, s.replace("_", " ").title())
+            return self._MODEL_TYPE_BY_KEY.get(s, s.replace("_", " ").title())
         return "Unknown"
\ No newline at end of file
@@ -19,15 +19,18 @@ class PinsTab:
         self.tree.pack(fill="both", expand=True, padx=10, pady=10)
 
     def populate(self, ibis_top):
-        for i in self.tree.get_children():
-            self.tree.delete(i)
-        for comp in ibis_top.cList:
-            for pin in comp.pList:
-                self.tree.insert("", "end", values=(
-                    pin.pinName,
-                    pin.signalName,
-                    pin.modelName,
-                    f"{pin.R_pin:.4f}" if pin.R_pin != CS.NOT_USED else "",
-                    f"{pin.L_pin:.4f}" if pin.L_pin != CS.NOT_USED else "",
-                    f"{pin.C_pin:.4f}" if pin.C_pin != CS.NOT_USED else ""
-                ))
\ No newline at end of file
+        rows = [
+            (
+                pin.pinName,
+                pin.signalName,
+                pin.modelName,
+                f"{pin.R_pin:.4f}" if pin.R_pin != CS.NOT_USED else "",
+                f"{pin.L_pin:.4f}" if pin.L_pin != CS.NOT_USED else "",
+                f"{pin.C_pin:.4f}" if pin.C_pin != CS.NOT_USED else ""
+            )
+            for comp in ibis_top.cList
+            for pin in comp.pList
+        ]
+        self.tree.delete(*self.tree.get_children())
+        for row in rows:
+            self.tree.insert("", "end", values=row)
\ No newline at end of file
@@ -15,8 +15,13 @@ class PlotsTab:
         self.ax = None
         self.canvas = None
         self.popout_window = None
+        self._built = False
 
-        self.build_ui()
+    def ensure_built(self):
+        # Widgets are created on first use (tab selected or file loaded)
+        if not self._built:
+            self._built = True
+            self.build_ui()
 
     def build_ui(self):
         main_pane = ttk.PanedWindow(self.frame, orient=tk.VERTICAL)
@@ -82,6 +87,7 @@ class PlotsTab:
         self.canvas_frame.pack(fill="both", expand=True, padx=8, pady=8)
 
     def load_ibs(self, ibs_path: Path):
+        self.ensure_built()
         if not ibs_path.exists():
             self.gui.log(f"IBIS file not found: {ibs_path.name}", "ERROR")
             return
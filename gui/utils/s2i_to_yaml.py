@@ -238,9 +238,10 @@ def convert_s2i_to_yaml(s2i_path: Path, yaml_path: Path):
     yaml_data["components"] = components
     
     # Write YAML file
+    text = yaml.dump(yaml_data, sort_keys=False, default_flow_style=False,
+                     indent=2, allow_unicode=True)
     with open(yaml_path, 'w', encoding='utf-8') as f:
-        yaml.dump(yaml_data, f, sort_keys=False, default_flow_style=False, 
-                 indent=2, allow_unicode=True)
+        f.write(text)
     
     print(f"Converted {s2i_path} -> {yaml_path}")
     print("You are now free from the past.")
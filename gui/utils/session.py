@@ -15,7 +15,8 @@ def load_session() -> dict:
 
 def save_session(data: dict) -> None:
     try:
+        text = json.dumps(data, indent=2)  # serialise first, then one write
         with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+            f.write(text)
     except Exception:
         pass
\ No newline at end of file
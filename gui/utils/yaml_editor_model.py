@@ -228,9 +228,10 @@ class YamlModel:
     def save_to_file(self, filepath: str) -> None:
         """Save model data to YAML file."""
         try:
+            text = yaml.dump(self.data, sort_keys=False,
+                             default_flow_style=False, indent=2, allow_unicode=True)
             with open(filepath, 'w', encoding='utf-8') as f:
-                yaml.dump(self.data, f, sort_keys=False, 
-                         default_flow_style=False, indent=2, allow_unicode=True)
+                f.write(text)
         except IOError as e:
             raise ValidationError(f"Cannot write file: {e}")
     
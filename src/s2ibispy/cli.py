@@ -345,11 +345,13 @@ def main(argv: Optional[list[str]] = None, gui: Optional[Any] = None) -> int:
         # Distinct non-zero code for 'simulator missing'
         return 11
 
-    input_file = os.path.abspath(args.input)
-    outdir = os.path.abspath(args.outdir)
-    os.makedirs(outdir, exist_ok=True)
+    source_path = Path(os.path.abspath(args.input))
+    outdir_path = Path(os.path.abspath(args.outdir))
+    outdir_path.mkdir(parents=True, exist_ok=True)
+    input_file = str(source_path)
+    outdir = str(outdir_path)
 
-    input_path = Path(input_file)
+    input_path = source_path
     if not input_path.exists():
         logging.error("Input file not found: %s", input_file)
         return 2
@@ -402,7 +404,7 @@ def main(argv: Optional[list[str]] = None, gui: Optional[Any] = None) -> int:
                         ref_files.append(str(val))
         except Exception:
             pass
-        _copy_spice_libraries(input_path.parent, Path(outdir), ref_files)
+        _copy_spice_libraries(input_path.parent, outdir_path, ref_files)
     except Exception as e:
         logging.debug("Library copy step skipped due to error: %s", e)
 
@@ -433,10 +435,10 @@ def main(argv: Optional[list[str]] = None, gui: Optional[Any] = None) -> int:
             base_name += ".ibs"
         logging.debug("Using user-specified IBIS filename: %s", base_name)
     else:
-        base_name = Path(input_file).stem + ".ibs"
+        base_name = source_path.stem + ".ibs"
         logging.info("No file_name specified → using input stem: %s", base_name)
 
-    out_file = Path(outdir) / base_name
+    out_file = outdir_path / base_name
     out_file.parent.mkdir(parents=True, exist_ok=True)
 
     logging.info("Writing IBIS to %s", out_file)
@@ -1,8 +1,12 @@
 """Package copy of correlation.py with package imports."""
+import heapq
 import os
+import re
 import sys
 import logging
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from jinja2 import Environment, FileSystemLoader, TemplateNotFound
 try:
     from jinja2 import PackageLoader, ChoiceLoader
@@ -10,12 +14,40 @@ except Exception:  # older jinja2 fallback
     PackageLoader = None
     ChoiceLoader = None
 from importlib.resources import files, as_file
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, FrozenSet, List, Tuple
 from s2ibispy.models import IbisModel, IbisTOP
 from s2ibispy.s2ispice import S2ISpice
 from s2ibispy.s2i_constants import ConstantStuff as CS
 from s2ibispy.s2ianaly import FindSupplyPins
 
+# Tokens in a flat netlist that are never treated as wrapper pins
+_NON_NODE_TOKENS = frozenset({"vdd", "vss", "gnd", "0", "pfet", "nfet", "w", "l", "m"})
+# Node-like identifiers: whole whitespace-delimited tokens, up to an optional "=value" suffix
+_NODE_TOKEN_RE = re.compile(r"(?<!\S)([a-z][a-z0-9_]*)(?=[\s=]|$)")
+# Wrapper-pin names recognised for each role in the correlation X-instances
+_IN_PIN_NAMES = frozenset({"in", "data", "d", "a"})
+_OE_PIN_NAMES = frozenset({"oe", "en", "enable", "tri"})
+_OUT_PIN_NAMES = frozenset({"out", "pad", "io", "y", "q"})
+_VDD_PIN_NAMES = frozenset({"vdd", "vcc", "vddio"})
+_VSS_PIN_NAMES = frozenset({"vss", "gnd", "0", "vssio"})
+# Model types never auto-selected for correlation / the ones it can drive
+_SKIP_MODEL_TYPES = frozenset({"POWER", "GND", "NC", "NOMODEL", "DUMMY"})
+_CORRELATABLE_MODEL_TYPES = frozenset({"I/O", "3-state"})
+# Source-checkout templates directory, relative to this module
+_REPO_TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "templates")
+# Preferred ordering of wrapper pins (name -> rank)
+_PIN_PRIORITY = {
+    name: rank for rank, name in enumerate(
+        ["in", "oe", "en", "enable", "out", "pad", "io", "in_sense", "sense"]
+    )
+}
+
+
+@dataclass(frozen=True, slots=True)
+class _FallbackPin:
+    """Stand-in for an IbisPin when no supply pin is mapped to the model."""
+    pinName: str
+
 
 def _get_base_path():
     """Get base path for resources, handling PyInstaller's _MEIPASS."""
@@ -36,86 +68,110 @@ def find_model_for_correlation(
         requested = requested_name.strip().lower()
         for m in ibis.mList:
             if m.modelName.lower() == requested:
-                logging.info(f"Correlation: Using requested model '{m.modelName}'")
+                logging.info("Correlation: Using requested model '%s'", m.modelName)
                 return m
-        logging.warning(f"Requested model '{requested_name}' not found — skipping correlation")
+        logging.warning("Requested model '%s' not found — skipping correlation", requested_name)
         return None
 
     for m in ibis.mList:
         if getattr(m, "noModel", False):
             continue
         mt = str(m.modelType).upper()
-        if mt not in {"POWER", "GND", "NC", "NOMODEL", "DUMMY"}:
-            logging.info(f"Correlation: Auto-selected model '{m.modelName}' (first real buffer)")
+        if mt not in _SKIP_MODEL_TYPES:
+            logging.info("Correlation: Auto-selected model '%s' (first real buffer)", m.modelName)
             return m
 
-    logging.info(f"Correlation: Using first model '{ibis.mList[0].modelName}' (fallback)")
+    logging.info("Correlation: Using first model '%s' (fallback)", ibis.mList[0].modelName)
     return ibis.mList[0]
 
 
+def _scan_netlist(path: str) -> Tuple[Optional[Tuple[str, ...]], FrozenSet[str], List[str]]:
+    """
+    Scan a SPICE netlist once. Returns (.subckt tokens or None, flat-netlist
+    node names, lines to copy into a wrapper).
+    """
+    # Single pass: stop at the first .subckt, otherwise collect flat-netlist nodes and
+    # keep the lines to copy into the wrapper (minus any .end/.ends terminators)
+    subckt_parts = None
+    nodes = set()
+    body_lines = []
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        for line in f:
+            body = line.lstrip()
+            if not body or line[0] in "*$":
+                body_lines.append(line)
+                continue
+            if body[:7].lower() == ".subckt":
+                subckt_parts = tuple(line.split())
+                break
+            if body[0] == "." and body.split(None, 1)[0].lower() in (".end", ".ends"):
+                continue
+            body_lines.append(line)
+            if line[0] == ".":
+                continue
+            # Lowercase only the lines that are actually scanned for nodes
+            body = body.lower()
+            if body[:1] in ("m", "c", "x"):
+                # Skip the device name of MOSFET/capacitor/subcircuit instances
+                parts = body.split(None, 1)
+                body = parts[1] if len(parts) > 1 else ""
+            for t in _NODE_TOKEN_RE.findall(body):
+                if t not in _NON_NODE_TOKENS:
+                    nodes.add(t)
+    return subckt_parts, frozenset(nodes), body_lines
+
+
 def prepare_netlist_for_correlation(model: IbisModel, outdir: str) -> dict:
     original_path = model.spice_file
     if not original_path or not os.path.exists(original_path):
         raise FileNotFoundError(f"Spice file not found: {original_path}")
 
-    with open(original_path, "r", encoding="utf-8", errors="ignore") as f:
-        content = f.read()
+    abs_path = os.path.abspath(original_path)
+    subckt_parts, nodes, body_lines = _scan_netlist(abs_path)
 
-    if any(line.strip().lower().startswith(".subckt") for line in content.splitlines()):
-        for line in content.splitlines():
-            if line.strip().lower().startswith(".subckt"):
-                parts = line.split()
-                name = parts[1].upper() if len(parts) > 1 else "IO_BUF"
-                pins = parts[2:] if len(parts) > 2 else []
-                break
-        else:
-            name = "IO_BUF"
-            pins = []
-        logging.info(f"Using existing subcircuit: {name}")
+    if subckt_parts is not None:
+        name = subckt_parts[1].upper() if len(subckt_parts) > 1 else "IO_BUF"
+        pins = list(subckt_parts[2:])
+        logging.info("Using existing subcircuit: %s", name)
         return {
             "is_subcircuit": True,
             "subcircuit_name": name,
-            "spice_include": f'.INCLUDE "{os.path.abspath(original_path)}"',
+            "spice_include": f'.INCLUDE "{abs_path}"',
             "pin_list": pins,
         }
 
     logging.info("Flat netlist → creating subcircuit wrapper")
     wrapper_name = f"{model.modelName.upper()}_WRAPPER"
 
-    nodes = set()
-    for line in content.splitlines():
-        l = line.lower()
-        if l.strip() == "" or l.startswith(("*", ".", "$")):
-            continue
-        tokens = l.split()
-        if not tokens:
-            continue
-        start = 1 if tokens[0][0] in "mcxMCX" else 0
-        for t in tokens[start:]:
-            t = t.split("=")[0]
-            if t.isalpha() or (t[0].isalpha() and t[1:].replace("_", "").isalnum()):
-                if t not in {"vdd", "vss", "gnd", "0", "pfet", "nfet", "w", "l", "m"}:
-                    nodes.add(t)
-
-    priority = ["in", "oe", "en", "enable", "out", "pad", "io", "in_sense", "sense"]
-    pins = sorted(nodes, key=lambda p: (priority.index(p.lower()) if p.lower() in priority else 999, p.lower()))[:4]
-    if "vdd" not in pins:
-        pins.append("vdd")
-    if "vss" not in pins:
-        pins.append("vss")
+    # Only the four best-ranked nodes are kept, so a partial sort is enough
+    pins = heapq.nsmallest(4, nodes, key=lambda p: (_PIN_PRIORITY.get(p, 999), p))
+    seen = set(pins)
+    for supply in ("vdd", "vss"):
+        if supply not in seen:
+            pins.append(supply)
+            seen.add(supply)
+
+    parts = [f"* Auto-generated subcircuit wrapper for {model.modelName}\n",
+             f".subckt {wrapper_name} {' '.join(pins)}\n\n"]
+    if getattr(model, "modelFile", None) and model.modelFile != "NA":
+        parts.append(f".INCLUDE \"{os.path.abspath(model.modelFile)}\"\n\n")
+    # Trailing blank lines are dropped so .ends follows the body after one blank line
+    parts.append("".join(body_lines).rstrip() + "\n")
+    parts.append(f"\n.ends {wrapper_name}\n")
+    content = "".join(parts)
 
     wrapper_path = os.path.join(outdir, f"{wrapper_name.lower()}.sp")
-    with open(wrapper_path, "w", encoding="utf-8") as f:
-        f.write(f"* Auto-generated subcircuit wrapper for {model.modelName}\n")
-        f.write(f".subckt {wrapper_name} {' '.join(pins)}\n\n")
-        if getattr(model, "modelFile", None) and model.modelFile != "NA":
-            f.write(f".INCLUDE \"{os.path.abspath(model.modelFile)}\"\n\n")
-        f.write(content.rstrip())
-        if not content.strip().endswith("\n"):
-            f.write("\n")
-        f.write(f"\n.ends {wrapper_name}\n")
-
-    logging.info(f"Wrapper created: {wrapper_path} → {wrapper_name} {' '.join(pins)}")
+    # Repeated correlation runs usually produce the same wrapper; leave it alone then
+    try:
+        with open(wrapper_path, "r", encoding="utf-8") as f:
+            unchanged = f.read() == content
+    except OSError:
+        unchanged = False
+    if not unchanged:
+        with open(wrapper_path, "w", encoding="utf-8", buffering=CS.WRITE_BUFFER_SIZE) as f:
+            f.write(content)
+
+    logging.info("Wrapper created: %s → %s %s", wrapper_path, wrapper_name, " ".join(pins))
 
     return {
         "is_subcircuit": True,
@@ -125,6 +181,49 @@ def prepare_netlist_for_correlation(model: IbisModel, outdir: str) -> dict:
     }
 
 
+@lru_cache(maxsize=8)
+def _correlation_env(template_dir: Optional[str], cwd: str) -> Environment:
+    """
+    Build the Jinja loader chain once per (template_dir, cwd); cwd is part of
+    the key because the repo-relative fallbacks resolve against it. The
+    Environment keeps Jinja's default auto_reload, so compiled templates are
+    reused until the template file changes on disk.
+    """
+    loaders = []
+    if template_dir and os.path.isdir(template_dir):
+        loaders.append(FileSystemLoader(template_dir))
+    
+    # PyInstaller bundled templates
+    base_path = _get_base_path()
+    bundled_templates = os.path.join(base_path, "templates")
+    if os.path.isdir(bundled_templates):
+        loaders.append(FileSystemLoader(bundled_templates))
+    
+    # packaged templates (for non-frozen runs)
+    if PackageLoader is not None:
+        try:
+            loaders.append(PackageLoader("s2ibispy", "templates"))
+        except Exception:
+            pass
+    
+    # repo-relative fallback
+    loaders.append(FileSystemLoader("templates"))
+    loaders.append(FileSystemLoader(_REPO_TEMPLATES_DIR))
+
+    if ChoiceLoader is not None and loaders:
+        return Environment(loader=ChoiceLoader(loaders))
+    return Environment(loader=loaders[0] if loaders else FileSystemLoader("."))
+
+
+def _correlation_template(template_dir: Optional[str], cwd: str):
+    try:
+        return _correlation_env(template_dir, cwd).get_template("compare_correlation.sp.j2")
+    except TemplateNotFound:
+        # last resort: direct filesystem
+        fallback_env = Environment(loader=FileSystemLoader("templates"))
+        return fallback_env.get_template("compare_correlation.sp.j2")
+
+
 def generate_and_run_correlation(
     model: IbisModel,
     ibis: IbisTOP,
@@ -136,12 +235,12 @@ def generate_and_run_correlation(
     writer = IbisWriter(ibis_head=None)
     mt_str = writer._model_type_str(getattr(model,'modelType', ''))
 
-    if mt_str not in {"I/O", "3-state"}:
-        logging.info(f"Skipping correlation for {model.modelName} — Model_type '{mt_str}' not supported")
+    if mt_str not in _CORRELATABLE_MODEL_TYPES:
+        logging.info("Skipping correlation for %s — Model_type '%s' not supported", model.modelName, mt_str)
         return None, 0
 
     if not getattr(model, "spice_file", None):
-        logging.info(f"Skipping correlation for {model.modelName} — no SPICE netlist defined")
+        logging.info("Skipping correlation for %s — no SPICE netlist defined", model.modelName)
         return None, 0
 
     if model is None:
@@ -155,7 +254,7 @@ def generate_and_run_correlation(
     try:
         netlist_info = prepare_netlist_for_correlation(model, outdir)
     except Exception as e:
-        logging.error(f"Failed to prepare netlist: {e}")
+        logging.error("Failed to prepare netlist: %s", e)
         return None, -1
 
     subcircuit_name = netlist_info["subcircuit_name"]
@@ -176,39 +275,58 @@ def generate_and_run_correlation(
             break
 
     if not pullup_pin:
-        vdd_name = next((p for p in pin_list if p.lower() in {"vdd", "vcc", "vddio"}), "vdd")
-        pullup_pin = type('obj', (), {'pinName': vdd_name})()
-        logging.info(f"Using fallback VDD pin: {vdd_name}")
+        vdd_name = next((p for p in pin_list if p.lower() in _VDD_PIN_NAMES), "vdd")
+        pullup_pin = _FallbackPin(vdd_name)
+        logging.info("Using fallback VDD pin: %s", vdd_name)
     if not pulldown_pin:
-        vss_name = next((p for p in pin_list if p.lower() in {"vss", "gnd", "0", "vssio"}), "vss")
-        pulldown_pin = type('obj', (), {'pinName': vss_name})()
-        logging.info(f"Using fallback VSS pin: {vss_name}")
+        vss_name = next((p for p in pin_list if p.lower() in _VSS_PIN_NAMES), "vss")
+        pulldown_pin = _FallbackPin(vss_name)
+        logging.info("Using fallback VSS pin: %s", vss_name)
+
+    # Resolve every wrapper-pin role once (first match wins, as before)
+    in_idx = oe_idx = out_idx = sense_idx = None
+    pin_pos: Dict[str, int] = {}
+    for i, p in enumerate(pin_list):
+        pin_pos.setdefault(p, i)
+        low = p.lower()
+        if in_idx is None and low in _IN_PIN_NAMES:
+            in_idx = i
+        if oe_idx is None and low in _OE_PIN_NAMES:
+            oe_idx = i
+        if out_idx is None and low in _OUT_PIN_NAMES:
+            out_idx = i
+        if sense_idx is None and "sense" in low:
+            sense_idx = i
+    in_idx = 0 if in_idx is None else in_idx
+    oe_idx = 1 if oe_idx is None else oe_idx
+    out_idx = 2 if out_idx is None else out_idx
+    vdd_idx = pin_pos.get(pullup_pin.pinName)
+    vss_idx = pin_pos.get(pulldown_pin.pinName)
+
+    # Supply connections are identical for every instance, so lay them out once;
+    # they take precedence if a signal role resolves to the same slot.
+    base_nodes = ["0"] * len(pin_list)
+    if vdd_idx is not None:
+        base_nodes[vdd_idx] = pullup_pin.pinName
+    if vss_idx is not None:
+        base_nodes[vss_idx] = pulldown_pin.pinName
+    supply_slots = {vdd_idx, vss_idx}
+    set_in = in_idx not in supply_slots
+    set_oe = oe_idx not in supply_slots
+    set_out = out_idx not in supply_slots
+    set_sense = sense_idx is not None and sense_idx not in supply_slots
 
     def make_instance(num: int, in_node: str, oe_node: str) -> str:
-        nodes = ["0"] * len(pin_list)
-
-        in_idx = next((i for i, p in enumerate(pin_list) if p.lower() in {"in", "data", "d", "a"}), 0)
-        oe_idx = next((i for i, p in enumerate(pin_list) if p.lower() in {"oe", "en", "enable", "tri"}), 1)
-        out_idx = next((i for i, p in enumerate(pin_list) if p.lower() in {"out", "pad", "io", "y", "q"}), 2)
-        sense_idx = next((i for i, p in enumerate(pin_list) if "sense" in p.lower()), None)
-
-        nodes[in_idx] = in_node
-        nodes[oe_idx] = oe_node
-        nodes[out_idx] = f"out{num}SPICE"
-        if sense_idx is not None:
+        nodes = base_nodes.copy()
+        if set_in:
+            nodes[in_idx] = in_node
+        if set_oe:
+            nodes[oe_idx] = oe_node
+        if set_out:
+            nodes[out_idx] = f"out{num}SPICE"
+        if set_sense:
             nodes[sense_idx] = f"sense{num}"
 
-        try:
-            vdd_idx = pin_list.index(pullup_pin.pinName)
-            nodes[vdd_idx] = pullup_pin.pinName
-        except ValueError:
-            pass
-        try:
-            vss_idx = pin_list.index(pulldown_pin.pinName)
-            nodes[vss_idx] = pulldown_pin.pinName
-        except ValueError:
-            pass
-
         return f"X{num}SPICE {' '.join(nodes)} {subcircuit_name}"
 
     x_instances = "\n".join([
@@ -228,38 +346,7 @@ VENA3 oe3 0 DC 3.3
     if isinstance(config, dict):
         template_dir = config.get("template_dir") or config.get("templates") or config.get("template_path")
 
-    loaders = []
-    if template_dir and os.path.isdir(template_dir):
-        loaders.append(FileSystemLoader(template_dir))
-    
-    # PyInstaller bundled templates
-    base_path = _get_base_path()
-    bundled_templates = os.path.join(base_path, "templates")
-    if os.path.isdir(bundled_templates):
-        loaders.append(FileSystemLoader(bundled_templates))
-    
-    # packaged templates (for non-frozen runs)
-    if PackageLoader is not None:
-        try:
-            loaders.append(PackageLoader("s2ibispy", "templates"))
-        except Exception:
-            pass
-    
-    # repo-relative fallback
-    loaders.append(FileSystemLoader("templates"))
-    loaders.append(FileSystemLoader(os.path.join(os.path.dirname(__file__), "..", "..", "templates")))
-
-    if ChoiceLoader is not None and loaders:
-        env = Environment(loader=ChoiceLoader(loaders))
-    else:
-        env = Environment(loader=loaders[0] if loaders else FileSystemLoader("."))
-
-    try:
-        template = env.get_template("compare_correlation.sp.j2")
-    except TemplateNotFound:
-        # last resort: direct filesystem
-        fallback_env = Environment(loader=FileSystemLoader("templates"))
-        template = fallback_env.get_template("compare_correlation.sp.j2")
+    template = _correlation_template(template_dir, os.getcwd())
 
     # packaged RLGC file path
     rlgc_path = None
@@ -296,7 +383,7 @@ VENA3 oe3 0 DC 3.3
     with open(out_path, "w", encoding="utf-8") as f:
         f.write(template.render(**context))
 
-    logging.info(f"Correlation deck created: {out_path}")
+    logging.info("Correlation deck created: %s", out_path)
 
     # Run the spice tool if provided
     if s2ispice is not None:
@@ -313,12 +400,12 @@ VENA3 oe3 0 DC 3.3
                 spice_msg=msg_file,
             )
             if rc == 0:
-                logging.info(f"Correlation SPICE run succeeded for {model.modelName}")
+                logging.info("Correlation SPICE run succeeded for %s", model.modelName)
             else:
-                logging.error(f"Correlation SPICE run failed for {model.modelName} — see {msg_file}")
+                logging.error("Correlation SPICE run failed for %s — see %s", model.modelName, msg_file)
             return out_path, rc
         except Exception as e:
-            logging.error(f"Correlation run failed: {e}")
+            logging.error("Correlation run failed: %s", e)
             return out_path, -1
 
     return out_path, 0
@@ -12,9 +12,24 @@ from s2ibispy.s2i_constants import ConstantStuff as CS
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
+# Precompiled patterns used on every logical line / numeric field
+_KEYWORD_RE = re.compile(r"\[(.*?)]\s*(.*)", re.IGNORECASE)
+_VERSION_RE = re.compile(r"^\d+(?:\.\d+)?$")
+_UNIT_SUFFIX_RE = re.compile(r"\s*(ohms?|Ω|[Vv]|[Hh]|[Ff]|[Ss]|[Aa]|[Hh][Zz]|[Cc])\s*$")
+_SI_NUMBER_RE = re.compile(r"^\s*([+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?)([TGMkmunpfa])?\s*$")
+_INCLUDE_RE = re.compile(r"^\s*\[(?i:include)]\s*(.+)?$")
+_SI_SCALE = {"T": 1e12, "G": 1e9, "M": 1e6, "k": 1e3, "m": 1e-3,
+             "u": 1e-6, "n": 1e-9, "p": 1e-12, "f": 1e-15, "a": 1e-18}
+_MULTILINE_KEYWORDS = frozenset({"source", "notes", "disclaimer", "copyright"})
+_SERIES_MODEL_TYPES = frozenset({str(CS.ModelType.SERIES), str(CS.ModelType.SERIES_SWITCH)})
+
 
 class S2IParser:
     def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Clear all accumulated state so the instance can parse another file."""
         self.ibis = IbisTOP(
             ibisVersion="3.2",
             thisFileName="",
@@ -113,7 +128,7 @@ class S2IParser:
             if not stripped:
                 continue
 
-            if stripped.startswith('+'):
+            if stripped[0] == '+':
                 # Continuation: append to previous logical line
                 frag = stripped[1:].lstrip()
                 if carry == "":
@@ -138,7 +153,8 @@ class S2IParser:
         # Main pass
         current_section = ""  # ← empty string = no section
         for line_num, line in logical_lines:
-            m = re.match(r"\[(.*?)]\s*(.*)", line, re.IGNORECASE)
+            # Only lines opening with '[' can be keywords; skip the regex for data rows
+            m = _KEYWORD_RE.match(line) if line[0] == "[" else None
             if m:
                 keyword, args = m.groups()
                 keyword = keyword.lower()
@@ -148,7 +164,7 @@ class S2IParser:
                     in_multiline = None
 
                 # HANDLE MULTI-LINE KEYWORDS
-                if keyword in {"source", "notes", "disclaimer", "copyright"}:
+                if keyword in _MULTILINE_KEYWORDS:
                     in_multiline = keyword
                     setattr(self.ibis, keyword, args + "\n")
                 else:
@@ -191,7 +207,7 @@ class S2IParser:
 
         # Close any open model
         if self.modelProc:
-            if self.pendingSeriesModel and self.tempModel.modelType in [str(CS.ModelType.SERIES), str(CS.ModelType.SERIES_SWITCH)]:
+            if self.pendingSeriesModel and self.tempModel.modelType in _SERIES_MODEL_TYPES:
                 self.tempModel.seriesModel = self.pendingSeriesModel
             self.mList.append(self.tempModel)
             self.modelCount += 1
@@ -213,7 +229,7 @@ class S2IParser:
                 logging.error(f"Line {line_num}: [IBIS Ver] must be first")
                 return
             ver = (args or "").strip()
-            if re.match(r'^\d+(?:\.\d+)?$', ver):
+            if _VERSION_RE.match(ver):
                 self.ibis.ibisVersion = ver
             else:
                 logging.warning(f"Line {line_num}: Unrecognized IBIS Ver '{args}', defaulting to 3.2")
@@ -519,7 +535,7 @@ class S2IParser:
         # ---------------------------
         if key == "model":
             if self.modelProc:
-                if self.pendingSeriesModel and self.tempModel.modelType in [str(CS.ModelType.SERIES), str(CS.ModelType.SERIES_SWITCH)]:
+                if self.pendingSeriesModel and self.tempModel.modelType in _SERIES_MODEL_TYPES:
                     self.tempModel.seriesModel = self.pendingSeriesModel
                 self.mList.append(self.tempModel)
                 self.modelCount += 1
@@ -958,21 +974,16 @@ class S2IParser:
         if text.upper() in {"NA", "N/A", "NAN"}:
             return CS.USE_NA
 
-        text = re.sub(r'\s*(ohms?|Ω|[Vv]|[Hh]|[Ff]|[Ss]|[Aa]|[Hh][Zz]|[Cc])\s*$', '', text)
+        text = _UNIT_SUFFIX_RE.sub('', text)
 
         # SI-suffixed float (single-letter SI before any unit we stripped)
-        m = re.match(
-            r'^\s*([+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?)([TGMkmunpfa])?\s*$',
-            text
-        )
+        m = _SI_NUMBER_RE.match(text)
         if m:
             base = float(m.group(1))
             suffix = m.group(2)
             if not suffix:
                 return base
-            scale = {"T": 1e12, "G": 1e9, "M": 1e6, "k": 1e3, "m": 1e-3,
-                     "u": 1e-6, "n": 1e-9, "p": 1e-12, "f": 1e-15, "a": 1e-18}[suffix]
-            return base * scale
+            return base * _SI_SCALE[suffix]
 
         # Fallback
         try:
@@ -983,7 +994,7 @@ class S2IParser:
 
     def _strip_inline_comment(self, line: str) -> str:
         # Strip anything after the first '|' (IBIS uses '|' for comments)
-        return line.split('|', 1)[0].rstrip()
+        return line.partition('|')[0].rstrip()
 
     def _read_with_includes(self, path: str, seen=None) -> List[str]:
         """
@@ -1000,17 +1011,24 @@ class S2IParser:
 
         try:
             with open(apath, 'r') as f:
-                raw = f.readlines()
+                text = f.read()
         except FileNotFoundError:
             logging.error(f"Include not found: {path}")
             return []
 
+        # One read + split instead of readlines() and a per-line rstrip; text
+        # mode has already normalised \r\n and \r to \n.
+        lines = text.split('\n')
+        if lines and not lines[-1]:
+            lines.pop()
+        if '[include]' not in text.lower():
+            return lines
+
         out: List[str] = []
         base_dir = os.path.dirname(apath)
-        for raw_line in raw:
-            line = raw_line.rstrip('\r\n')
+        for line in lines:
             # Detect section header of [Include] <relative/or/absolute/path>
-            m = re.match(r'^\s*\[(?i:include)]\s*(.+)?$', line)
+            m = _INCLUDE_RE.match(line)
             if m:
                 inc_arg = (m.group(1) or '').strip()
                 if inc_arg:
@@ -231,6 +231,11 @@ class S2IUtil:
 
     def validate_pin_links(self, ibis: IbisTOP) -> None:
         for comp in ibis.cList:
+            # Lower-cased name -> first pin, same answer as get_matching_pin() per lookup
+            pins_by_name: Dict[str, IbisPin] = {}
+            for pin in comp.pList:
+                pins_by_name.setdefault((pin.pinName or "").lower(), pin)
+
             for pin in comp.pList:
                 name = (pin.modelName or "").strip()
                 if name and name.upper() not in {"POWER", "GND", "NC", "NOMODEL", "DUMMY", "#"}:
@@ -239,26 +244,27 @@ class S2IUtil:
                                       comp.component, pin.pinName, pin.modelName)
 
                 if getattr(pin, "inputPin", ""):
-                    if self.get_matching_pin(pin.inputPin, comp.pList) is None:
+                    if pins_by_name.get(pin.inputPin.lower()) is None:
                         logging.error("Component '%s': pin '%s' references missing input pin '%s'",
                                       comp.component, pin.pinName, pin.inputPin)
 
                 if getattr(pin, "enablePin", ""):
-                    if self.get_matching_pin(pin.enablePin, comp.pList) is None:
+                    if pins_by_name.get(pin.enablePin.lower()) is None:
                         logging.error("Component '%s': pin '%s' references missing enable pin '%s'",
                                       comp.component, pin.pinName, pin.enablePin)
 
             if getattr(comp, "dpList", None):
                 for dp in comp.dpList:
-                    if self.get_matching_pin(dp.invPin, comp.pList) is None:
+                    if not dp.invPin or pins_by_name.get(dp.invPin.lower()) is None:
                         logging.error("Component '%s': Diff pin '%s' not found",
                                       comp.component, dp.invPin)
 
     def get_matching_pin(self, search_name: str, pList: List[IbisPin]) -> Optional[IbisPin]:
         if not search_name:
             return None
+        wanted = search_name.lower()
         for pin in pList:
-            if search_name.lower() == (pin.pinName or "").lower():
+            if wanted == (pin.pinName or "").lower():
                 return pin
         return None
 
@@ -267,8 +273,9 @@ class S2IUtil:
             return None
         if search_name.upper() in {"GND", "POWER", "NC", "NOMODEL", "DUMMY", "#"}:
             return None
+        wanted = search_name.lower()
         for model in mList:
-            if search_name.lower() == (model.modelName or "").lower():
+            if wanted == (model.modelName or "").lower():
                 return model
         logging.warning("Model %s not found", search_name)
         return None
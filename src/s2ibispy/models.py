@@ -10,12 +10,15 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Union
 from s2ibispy.s2i_constants import ConstantStuff as CS
 
+# Shared NaN default; floats are immutable so one object serves every field
+_NAN: float = float('nan')
 
-@dataclass
+
+@dataclass(slots=True)
 class IbisTypMinMax:
-    typ: float = float('nan')
-    min: float = float('nan')
-    max: float = float('nan')
+    typ: float = _NAN
+    min: float = _NAN
+    max: float = _NAN
 
 
 # Factory function
@@ -23,20 +26,20 @@ def tmm_factory():
     return IbisTypMinMax()
 
 
-@dataclass
+@dataclass(slots=True)
 class IbisPinParasitics:
     R_pkg: IbisTypMinMax = field(default_factory=tmm_factory)
     L_pkg: IbisTypMinMax = field(default_factory=tmm_factory)
     C_pkg: IbisTypMinMax = field(default_factory=tmm_factory)
 
 
-@dataclass
+@dataclass(slots=True)
 class IbisVItableEntry:
     v: float = 0.0
     i: IbisTypMinMax = field(default_factory=IbisTypMinMax)
 
 
-@dataclass
+@dataclass(slots=True)
 class IbisVItable:
     VIs: List[IbisVItableEntry] = field(default_factory=list)
     size: int = 0
@@ -55,26 +58,26 @@ class IbisVItable:
         self.size = len(self.VIs)
 
 
-@dataclass
+@dataclass(slots=True)
 class IbisWaveTableEntry:
     t: float = 0.0
     v: IbisTypMinMax = field(default_factory=IbisTypMinMax)
     i: IbisTypMinMax = field(default_factory=IbisTypMinMax)  # Supply current in Amperes
 
 
-@dataclass
+@dataclass(slots=True)
 class IbisWaveTable:
     waveData: List[IbisWaveTableEntry] = field(default_factory=list)
     size: int = 0
     R_fixture: float = 0.0
     V_fixture: float = 0.0
-    V_fixture_min: float = float('nan')
-    V_fixture_max: float = float('nan')
-    L_dut: float = float('nan')
-    R_dut: float = float('nan')
-    C_dut: float = float('nan')
-    L_fixture: float = float('nan')
-    C_fixture: float = float('nan')
+    V_fixture_min: float = _NAN
+    V_fixture_max: float = _NAN
+    L_dut: float = _NAN
+    R_dut: float = _NAN
+    C_dut: float = _NAN
+    L_fixture: float = _NAN
+    C_fixture: float = _NAN
 
     def add_point(self, t: float, v_typ: Optional[float] = None, v_min: Optional[float] = None, v_max: Optional[float] = None,
                   i_typ: Optional[float] = None, i_min: Optional[float] = None, i_max: Optional[float] = None) -> None:
@@ -97,7 +100,7 @@ class IbisWaveTable:
         self.size = len(self.waveData)
 
 
-@dataclass
+@dataclass(slots=True)
 class IbisRamp:
     dv_r: IbisTypMinMax = field(default_factory=IbisTypMinMax)
     dt_r: IbisTypMinMax = field(default_factory=IbisTypMinMax)
@@ -106,7 +109,7 @@ class IbisRamp:
     derateRampPct: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class SeriesModel:
     OnState: bool = False
     OffState: bool = True
@@ -114,7 +117,7 @@ class SeriesModel:
     vdslist: List[float] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class IbisDiffPin:
     pinName: str = ""
     invPin: str = ""
@@ -124,7 +127,7 @@ class IbisDiffPin:
     tdelay_max: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IbisSeriesPin:
     pin1: str = ""
     pin2: str = ""
@@ -132,7 +135,7 @@ class IbisSeriesPin:
     fnTableGp: str = ""               # optional function_table_group (manual)
 
 
-@dataclass
+@dataclass(slots=True)
 class IbisSeriesSwitchGroup:
     pins: List[str] = field(default_factory=list)
 
@@ -296,7 +299,7 @@ class IbisModel:
         return mt in (CS.ModelType.OPEN_SOURCE, CS.ModelType.IO_OPEN_SOURCE)
 
 
-@dataclass
+@dataclass(slots=True)
 class IbisPin:
     pinName: str = ""
     signalName: str = ""
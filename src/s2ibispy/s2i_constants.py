@@ -234,6 +234,7 @@ class ConstantStuff:
     VI_ROW_RE = re.compile(rf"^\s*({FLOAT_RE})\s+({FLOAT_RE})\s*$")
 
     MAX_READ_RETRIES = 1
+    WRITE_BUFFER_SIZE = 1 << 18          # 256 KiB buffer for generated .ibs/.sp files
 
     VERSION_ONE_ZERO = 100
     VERSION_ONE_ONE = 101
@@ -45,9 +45,11 @@ def _as_model_type(val: ModelTypeLike) -> Optional[CS.ModelType]:
         return None
     return None
 
+_ECL_MODEL_TYPES = frozenset({CS.ModelType.OUTPUT_ECL, CS.ModelType.IO_ECL})
+
+
 def _is_ecl(model_type: ModelTypeLike) -> bool:
-    mt = _as_model_type(model_type)
-    return mt in {CS.ModelType.OUTPUT_ECL, CS.ModelType.IO_ECL}
+    return _as_model_type(model_type) in _ECL_MODEL_TYPES
 
 def _subtract_disabled_in_place(enabled: IbisVItable, disabled: IbisVItable) -> None:
     """enabled := enabled - disabled, IBIS-style: subtract currents point by point.
@@ -57,110 +59,119 @@ def _subtract_disabled_in_place(enabled: IbisVItable, disabled: IbisVItable) ->
         return
 
     n = min(enabled.size, disabled.size, len(enabled.VIs), len(disabled.VIs))
-    for i in range(n):
-        e = enabled.VIs[i].i
-        d = disabled.VIs[i].i
-
-        # typ
-        if math.isnan(e.typ) or math.isnan(d.typ):
-            e.typ = float('nan')
-        else:
-            e.typ -= d.typ
-
-        # min
-        if math.isnan(e.min) or math.isnan(d.min):
-            e.min = float('nan')
-        else:
-            e.min -= d.min
-
-        # max
-        if math.isnan(e.max) or math.isnan(d.max):
-            e.max = float('nan')
-        else:
-            e.max -= d.max
+    # NaN propagates through subtraction, so plain differences already give NA
+    # wherever either side is NA.
+    for e_entry, d_entry in zip(enabled.VIs[:n], disabled.VIs[:n]):
+        e = e_entry.i
+        d = d_entry.i
+        e.typ -= d.typ
+        e.min -= d.min
+        e.max -= d.max
 
     if enabled.size != disabled.size:
         logging.warning("Disabled subtraction used mismatched table sizes (enabled=%d, disabled=%d); truncated to %d",
                         enabled.size, disabled.size, n)
 
+def _derate_vi_table(table: IbisVItable, derate_pct: float) -> None:
+    """Widen min/max currents of the first table.size points by derate_pct percent, in place."""
+    if not derate_pct:
+        return
+    frac = derate_pct / 100.0
+    for entry in table.VIs[:table.size]:
+        vi = entry.i
+        mn = vi.min
+        if mn == mn:
+            vi.min = mn - mn * frac
+        mx = vi.max
+        if mx == mx:
+            vi.max = mx + mx * frac
+
 # ---------- “needs data” gates (aligned to s2ibis3 Java intent, minus INPUT_ECL) ----------
+# Gate tables are built once; the functions below only do a membership test.
+_PULLUP_MODEL_TYPES = frozenset({
+    CS.ModelType.OUTPUT,
+    CS.ModelType.THREE_STATE,
+    CS.ModelType.IO,
+    CS.ModelType.OPEN_SOURCE,
+    CS.ModelType.IO_OPEN_SOURCE,
+    CS.ModelType.OUTPUT_ECL,
+    CS.ModelType.IO_ECL,
+})
+
+_PULLDOWN_MODEL_TYPES = frozenset({
+    CS.ModelType.OUTPUT,
+    CS.ModelType.THREE_STATE,
+    CS.ModelType.IO,
+    CS.ModelType.OPEN_SINK,
+    CS.ModelType.IO_OPEN_SINK,
+    CS.ModelType.OPEN_DRAIN,
+    CS.ModelType.IO_OPEN_DRAIN,
+    CS.ModelType.OUTPUT_ECL,
+    CS.ModelType.IO_ECL,
+})
+
+_POWER_CLAMP_MODEL_TYPES = frozenset({
+    CS.ModelType.INPUT,
+    CS.ModelType.THREE_STATE,
+    CS.ModelType.IO,
+    CS.ModelType.IO_OPEN_SOURCE,
+    CS.ModelType.INPUT_ECL,
+    CS.ModelType.IO_ECL,
+    CS.ModelType.TERMINATOR,
+})
+
+_GND_CLAMP_MODEL_TYPES = frozenset({
+    CS.ModelType.INPUT,
+    CS.ModelType.THREE_STATE,
+    CS.ModelType.IO,
+    CS.ModelType.OPEN_SINK,
+    CS.ModelType.IO_OPEN_SINK,
+    CS.ModelType.OPEN_DRAIN,
+    CS.ModelType.IO_OPEN_DRAIN,
+    CS.ModelType.INPUT_ECL,
+    CS.ModelType.IO_ECL,
+    CS.ModelType.TERMINATOR,
+})
+
+_TRANSIENT_MODEL_TYPES = frozenset({
+    CS.ModelType.OUTPUT,
+    CS.ModelType.THREE_STATE,
+    CS.ModelType.IO,
+    CS.ModelType.OPEN_SINK,
+    CS.ModelType.IO_OPEN_SINK,
+    CS.ModelType.OPEN_DRAIN,
+    CS.ModelType.IO_OPEN_DRAIN,
+    CS.ModelType.OPEN_SOURCE,
+    CS.ModelType.IO_OPEN_SOURCE,
+    CS.ModelType.OUTPUT_ECL,
+    CS.ModelType.IO_ECL,
+})
+
+_SERIES_MODEL_TYPES = frozenset({CS.ModelType.SERIES, CS.ModelType.SERIES_SWITCH})
+
+
 def this_model_needs_pullup_data(model_type: ModelTypeLike) -> bool:
-    mt = _as_model_type(model_type)
-    return mt in {
-        CS.ModelType.OUTPUT,
-        CS.ModelType.THREE_STATE,
-        CS.ModelType.IO,
-        CS.ModelType.OPEN_SOURCE,
-        CS.ModelType.IO_OPEN_SOURCE,
-        CS.ModelType.OUTPUT_ECL,
-        CS.ModelType.IO_ECL,
-    }
+    return _as_model_type(model_type) in _PULLUP_MODEL_TYPES
 
 
 def this_model_needs_pulldown_data(model_type: ModelTypeLike) -> bool:
-    mt = _as_model_type(model_type)
-    return mt in {
-        CS.ModelType.OUTPUT,
-        CS.ModelType.THREE_STATE,
-        CS.ModelType.IO,
-        CS.ModelType.OPEN_SINK,
-        CS.ModelType.IO_OPEN_SINK,
-        CS.ModelType.OPEN_DRAIN,
-        CS.ModelType.IO_OPEN_DRAIN,
-        CS.ModelType.OUTPUT_ECL,
-        CS.ModelType.IO_ECL,
-    }
+    return _as_model_type(model_type) in _PULLDOWN_MODEL_TYPES
 
 
 def this_model_needs_power_clamp_data(model_type: ModelTypeLike) -> bool:
-    mt = _as_model_type(model_type)
-    return mt in {
-        CS.ModelType.INPUT,
-        CS.ModelType.THREE_STATE,
-        CS.ModelType.IO,
-        CS.ModelType.IO_OPEN_SOURCE,
-        CS.ModelType.INPUT_ECL,
-        CS.ModelType.IO_ECL,
-        CS.ModelType.TERMINATOR,
-    }
+    return _as_model_type(model_type) in _POWER_CLAMP_MODEL_TYPES
 
 
 def this_model_needs_gnd_clamp_data(model_type: ModelTypeLike) -> bool:
-    mt = _as_model_type(model_type)
-    return mt in {
-        CS.ModelType.INPUT,
-        CS.ModelType.THREE_STATE,
-        CS.ModelType.IO,
-        CS.ModelType.OPEN_SINK,
-        CS.ModelType.IO_OPEN_SINK,
-        CS.ModelType.OPEN_DRAIN,
-        CS.ModelType.IO_OPEN_DRAIN,
-        CS.ModelType.INPUT_ECL,
-        CS.ModelType.IO_ECL,
-        CS.ModelType.TERMINATOR,
-    }
+    return _as_model_type(model_type) in _GND_CLAMP_MODEL_TYPES
 
 
 def this_model_needs_transient_data(model_type: ModelTypeLike) -> bool:
-    mt = _as_model_type(model_type)
-    return mt in {
-        CS.ModelType.OUTPUT,
-        CS.ModelType.THREE_STATE,
-        CS.ModelType.IO,
-        CS.ModelType.OPEN_SINK,
-        CS.ModelType.IO_OPEN_SINK,
-        CS.ModelType.OPEN_DRAIN,
-        CS.ModelType.IO_OPEN_DRAIN,
-        CS.ModelType.OPEN_SOURCE,
-        CS.ModelType.IO_OPEN_SOURCE,
-        CS.ModelType.OUTPUT_ECL,
-        CS.ModelType.IO_ECL,
-    }
+    return _as_model_type(model_type) in _TRANSIENT_MODEL_TYPES
 
 
 def this_model_needs_series_vi_data(model_type: ModelTypeLike) -> bool:
-    mt = _as_model_type(model_type)
-    return mt in {CS.ModelType.SERIES, CS.ModelType.SERIES_SWITCH}
+    return _as_model_type(model_type) in _SERIES_MODEL_TYPES
 
 def this_pin_needs_analysis(model_name: str) -> bool:
     # Skip pseudo/special pins and explicit [NoModel]
@@ -192,8 +203,6 @@ class SetupVoltages:
     gnd: IbisTypMinMax = field(default_factory=IbisTypMinMax)
 
     def setup_voltages(self, curve_type: int, model: IbisModel) -> None:
-        zeros = IbisTypMinMax(0.0, 0.0, 0.0)
-
         # ← FIXED: Copy to local variables to avoid modifying model
         pullup_ref = IbisTypMinMax(
             typ=model.voltageRange.typ if is_use_na(model.pullupRef.typ) else model.pullupRef.typ,
@@ -414,10 +423,13 @@ class FindSupplyPins:
             "gndClampPin": None,
         }
 
+        # One pass over the component: supply pins in list order
+        supply_pins = [p for p in pin_list if p.modelName.upper() in ("POWER", "GND")]
+
         if not has_pin_mapping:
             # Legacy mode: no [Pin Mapping] → use first POWER/GND
-            power_pin = next((p for p in pin_list if p.modelName.upper() == "POWER"), None)
-            gnd_pin   = next((p for p in pin_list if p.modelName.upper() == "GND"), None)
+            power_pin = next((p for p in supply_pins if p.modelName.upper() == "POWER"), None)
+            gnd_pin   = next((p for p in supply_pins if p.modelName.upper() == "GND"), None)
 
             if not power_pin:
                 logging.error("No pin with model_name = POWER found")
@@ -438,9 +450,7 @@ class FindSupplyPins:
 
             ref_str = str(ref_value).strip().upper()
 
-            for pin in pin_list:
-                if pin.modelName.upper() not in ("POWER", "GND"):
-                    continue
+            for pin in supply_pins:
                 candidate = getattr(pin, ref_field_name, None)
                 if self._is_nc(candidate):
                     continue
@@ -486,8 +496,9 @@ class SortVIData:
             vcc = setup_v.vcc
 
             # Vcc-relative in place (like Java)
-            for i in range(pullup_data.size):
-                pullup_data.VIs[i].v = vcc.typ - pullup_data.VIs[i].v
+            vcc_typ = vcc.typ
+            for entry in pullup_data.VIs[:pullup_data.size]:
+                entry.v = vcc_typ - entry.v
 
             num_table_pts = int(abs(sweep_range / sweep_step)) + 1
             if num_table_pts <= 0:
@@ -505,11 +516,7 @@ class SortVIData:
                 model.pullup.VIs[i] = pullup_data.VIs[j]
                 j -= 1
 
-            if model.derateVIPct:
-                for i in range(model.pullup.size):
-                    vi = model.pullup.VIs[i].i
-                    if not is_use_na(vi.min): vi.min -= vi.min * (model.derateVIPct / 100.0)
-                    if not is_use_na(vi.max): vi.max += vi.max * (model.derateVIPct / 100.0)
+            _derate_vi_table(model.pullup, model.derateVIPct)
 
         # --- Pulldown ---
         if pulldown_data is not None and pulldown_data.size > 0:
@@ -535,11 +542,7 @@ class SortVIData:
             # Ensure last point equals last input point
             model.pulldown.VIs[model.pulldown.size - 1] = pulldown_data.VIs[pulldown_data.size - 1]
 
-            if model.derateVIPct:
-                for i in range(model.pulldown.size):
-                    vi = model.pulldown.VIs[i].i
-                    if not is_use_na(vi.min): vi.min -= vi.min * (model.derateVIPct / 100.0)
-                    if not is_use_na(vi.max): vi.max += vi.max * (model.derateVIPct / 100.0)
+            _derate_vi_table(model.pulldown, model.derateVIPct)
 
         # --- Power clamp ---
         if power_clamp_data is not None and power_clamp_data.size > 0:
@@ -564,11 +567,7 @@ class SortVIData:
                 i -= 1
                 j += 1
 
-            if model.derateVIPct:
-                for k in range(model.power_clamp.size):
-                    vi = model.power_clamp.VIs[k].i
-                    if not is_use_na(vi.min): vi.min -= vi.min * (model.derateVIPct / 100.0)
-                    if not is_use_na(vi.max): vi.max += vi.max * (model.derateVIPct / 100.0)
+            _derate_vi_table(model.power_clamp, model.derateVIPct)
 
         # --- Ground clamp ---
         if gnd_clamp_data is not None and gnd_clamp_data.size > 0:
@@ -590,11 +589,7 @@ class SortVIData:
                 model.gnd_clamp.VIs[j] = gnd_clamp_data.VIs[j]
                 j += 1
 
-            if model.derateVIPct:
-                for k in range(model.gnd_clamp.size):
-                    vi = model.gnd_clamp.VIs[k].i
-                    if not is_use_na(vi.min): vi.min -= vi.min * (model.derateVIPct / 100.0)
-                    if not is_use_na(vi.max): vi.max += vi.max * (model.derateVIPct / 100.0)
+            _derate_vi_table(model.gnd_clamp, model.derateVIPct)
 
         # --- ISSO_PU ---
         if isso_pullup_data is not None and isso_pullup_data.size > 0:
@@ -633,11 +628,7 @@ class SortVIData:
                 else:
                     model.isso_pullup.VIs[i].i.max = isso_pullup_data.VIs[j_current].i.max
 
-            if model.derateVIPct:
-                for i in range(model.isso_pullup.size):
-                    vi = model.isso_pullup.VIs[i].i
-                    if not is_use_na(vi.min): vi.min -= vi.min * (model.derateVIPct / 100.0)
-                    if not is_use_na(vi.max): vi.max += vi.max * (model.derateVIPct / 100.0)
+            _derate_vi_table(model.isso_pullup, model.derateVIPct)
 
         # --- ISSO_PD ---
         if isso_pulldown_data is not None and isso_pulldown_data.size > 0:
@@ -670,11 +661,7 @@ class SortVIData:
             # Ensure last point equals last input point
             model.isso_pulldown.VIs[model.isso_pulldown.size - 1] = model.isso_pulldown.VIs[model.isso_pulldown.size - 1]
 
-            if model.derateVIPct:
-                for i in range(model.isso_pulldown.size):
-                    vi = model.isso_pulldown.VIs[i].i
-                    if not is_use_na(vi.min): vi.min -= vi.min * (model.derateVIPct / 100.0)
-                    if not is_use_na(vi.max): vi.max += vi.max * (model.derateVIPct / 100.0)
+            _derate_vi_table(model.isso_pulldown, model.derateVIPct)
 
         return 0
 
@@ -1047,24 +1034,13 @@ class AnalyzePin:
             return
         n = min(getattr(main_vi, "size", len(main_vi.VIs)),
                 getattr(disabled_vi, "size", len(disabled_vi.VIs)))
-        for i in range(n):
-            m = main_vi.VIs[i].i
-            d = disabled_vi.VIs[i].i
-            # typ
-            if not is_use_na(m.typ) and not is_use_na(d.typ):
-                m.typ = m.typ - d.typ
-            else:
-                m.typ = CS.USE_NA
-            # min
-            if not is_use_na(m.min) and not is_use_na(d.min):
-                m.min = m.min - d.min
-            else:
-                m.min = CS.USE_NA
-            # max
-            if not is_use_na(m.max) and not is_use_na(d.max):
-                m.max = m.max - d.max
-            else:
-                m.max = CS.USE_NA
+        # CS.USE_NA is NaN, and NaN propagates through subtraction
+        for m_entry, d_entry in zip(main_vi.VIs[:n], disabled_vi.VIs[:n]):
+            m = m_entry.i
+            d = d_entry.i
+            m.typ -= d.typ
+            m.min -= d.min
+            m.max -= d.max
 
 # ---------- per-component orchestrator ----------
 class AnalyzeComponent:
@@ -1097,6 +1073,12 @@ class AnalyzeComponent:
 
             self.s2ispice.current_component = component  # ← Set before pin loop
 
+            # Case-insensitive pin-name index (first occurrence wins, like a linear scan)
+            pins_by_name: Dict[str, IbisPin] = {}
+            for p in component.pList:
+                if p.pinName:
+                    pins_by_name.setdefault(p.pinName.lower(), p)
+
             for pin in component.pList:
                 logging.info("Analyzing pin '%s' with modelName '%s'", pin.pinName, pin.modelName)
 
@@ -1134,17 +1116,8 @@ class AnalyzeComponent:
                     result += 1
                     continue
 
-                def _find_pin_by_name(name: str, pin_list: List[IbisPin]) -> Optional[IbisPin]:
-                    if not name:
-                        return None
-                    name_lower = name.lower()
-                    for p in pin_list:
-                        if p.pinName and p.pinName.lower() == name_lower:
-                            return p
-                    return None
-
-                enable_pin = _find_pin_by_name(pin.enablePin, component.pList) if pin.enablePin else None
-                input_pin = _find_pin_by_name(pin.inputPin, component.pList) if pin.inputPin else None
+                enable_pin = pins_by_name.get(pin.enablePin.lower()) if pin.enablePin else None
+                input_pin = pins_by_name.get(pin.inputPin.lower()) if pin.inputPin else None
 
                 if pin.enablePin and not enable_pin:
                     logging.error("Could not find enable pin for %s", pin.pinName)
@@ -1,7 +1,6 @@
 # s2ioutput.py — FINAL, CORRECT, MERGED VERSION
 import logging
 import re
-import math
 from typing import List, Optional
 from s2ibispy.models import (
     IbisTOP, IbisGlobal, IbisComponent, IbisModel, IbisPin,
@@ -12,15 +11,67 @@ from s2ibispy.s2i_constants import ConstantStuff as CS
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
+# Row templates for VI tables and waveform/composite-current tables (format spec parsed once)
+_VI_ROW = "{:>8}  {:>12}  {:>12}  {:>12}\n".format
+_WAVE_ROW = "{:>15}  {:>15}  {:>15}  {:>15}\n".format
+_NUMERIC_VERSION_RE = re.compile(r"^\d+(?:\.\d+)?$")
+# SI scale suffixes used by IbisWriter._si — CRITICAL: START FROM LARGEST SCALE → SMALLEST
+_SI_SCALES = (
+    ("M", 1e6), ("k", 1e3), ("", 1),
+    ("m", 1e-3), ("u", 1e-6), ("n", 1e-9), ("p", 1e-12),
+)
+
 
 class IbisWriter:
+    # Lookup tables shared by all writer instances
+    _IBIS_VERSIONS = {
+        # Supported official IBIS versions
+        "1.1": CS.VERSION_ONE_ONE,
+        "2.1": CS.VERSION_TWO_ONE,
+        "3.2": CS.VERSION_THREE_TWO,
+        "4.2": CS.VERSION_FOUR_TWO,
+        "5.1": CS.VERSION_FIVE_ONE,
+        "6.0": CS.VERSION_SIX_ZERO,
+        "6.1": CS.VERSION_SIX_ONE,
+        "7.0": CS.VERSION_SEVEN_ZERO,
+        "7.1": CS.VERSION_SEVEN_ONE,
+        "7.2": CS.VERSION_SEVEN_TWO,
+    }
+    _IBIS_VERSION_NAMES = {v: k for k, v in _IBIS_VERSIONS.items()}
+    _MODEL_TYPE_NAMES = {
+        CS.ModelType.INPUT: "Input",
+        CS.ModelType.OUTPUT: "Output",
+        CS.ModelType.IO: "I/O",
+        CS.ModelType.THREE_STATE: "3-state",
+        CS.ModelType.OPEN_DRAIN: "Open_drain",
+        CS.ModelType.OPEN_SINK: "Open_sink",
+        CS.ModelType.OPEN_SOURCE: "Open_source",
+        CS.ModelType.IO_OPEN_DRAIN: "I/O_Open_drain",
+        CS.ModelType.IO_OPEN_SINK: "I/O_Open_sink",
+        CS.ModelType.IO_OPEN_SOURCE: "I/O_Open_source",
+        CS.ModelType.SERIES: "Series",
+        CS.ModelType.SERIES_SWITCH: "Series_switch",
+        CS.ModelType.TERMINATOR: "Terminator",
+        CS.ModelType.INPUT_ECL: "Input_ECL",
+        CS.ModelType.OUTPUT_ECL: "Output_ECL",
+        CS.ModelType.IO_ECL: "I/O_ECL",
+    }
+    _POLARITY_NAMES = {
+        CS.MODEL_POLARITY_NON_INVERTING: "Non-Inverting",
+        CS.MODEL_POLARITY_INVERTING: "Inverting",
+    }
+    _ENABLE_NAMES = {
+        CS.MODEL_ENABLE_ACTIVE_HIGH: "Active-High",
+        CS.MODEL_ENABLE_ACTIVE_LOW: "Active-Low",
+    }
+
     def __init__(self, ibis_head: IbisTOP):
         self.ibis_head = ibis_head
 
     def write_ibis_file(self, filename: Optional[str] = None) -> int:
         filename = filename or self.ibis_head.thisFileName or "buffer.ibs"
         try:
-            with open(filename, "w", encoding="utf-8") as f:
+            with open(filename, "w", encoding="utf-8", buffering=CS.WRITE_BUFFER_SIZE) as f:
                 self._print_top(f)
             logging.info(f"IBIS file written: {filename}")
             return 0
@@ -29,30 +80,17 @@ class IbisWriter:
             return 1
 
     def _print_top(self, f) -> None:
-        f.write("|************************************************************************\n")
-        f.write(f"| IBIS file {self.ibis_head.thisFileName} created by PYS2IBIS3\n")
-        f.write("| Missouri S&T EMC Lab\n")
-        f.write("|************************************************************************\n\n")
-
-        ver_map = {
-            # Supported official IBIS versions
-            "1.1": CS.VERSION_ONE_ONE,
-            "2.1": CS.VERSION_TWO_ONE,
-            "3.2": CS.VERSION_THREE_TWO,
-            "4.2": CS.VERSION_FOUR_TWO,
-            "5.1": CS.VERSION_FIVE_ONE,
-            "6.0": CS.VERSION_SIX_ZERO,
-            "6.1": CS.VERSION_SIX_ONE,
-            "7.0": CS.VERSION_SEVEN_ZERO,
-            "7.1": CS.VERSION_SEVEN_ONE,
-            "7.2": CS.VERSION_SEVEN_TWO,
-        }
+        f.write("|************************************************************************\n"
+                f"| IBIS file {self.ibis_head.thisFileName} created by PYS2IBIS3\n"
+                "| Missouri S&T EMC Lab\n"
+                "|************************************************************************\n\n")
+
         requested_ver = (self.ibis_head.ibisVersion or "3.2").strip()
-        ibis_ver_int = ver_map.get(requested_ver, CS.VERSION_THREE_TWO)
-        version_str = {v: k for k, v in ver_map.items()}.get(ibis_ver_int, "3.2")
+        ibis_ver_int = self._IBIS_VERSIONS.get(requested_ver, CS.VERSION_THREE_TWO)
+        version_str = self._IBIS_VERSION_NAMES.get(ibis_ver_int, "3.2")
 
         # Prefer printing the exact version string if it looks numeric
-        print_ver = requested_ver if re.match(r'^\d+(?:\.\d+)?$', requested_ver) else version_str
+        print_ver = requested_ver if _NUMERIC_VERSION_RE.match(requested_ver) else version_str
 
         self._print_keyword(f, "[IBIS Ver]", print_ver)
         # Ensure [File Name] ends with .ibs per ibischk expectation
@@ -151,13 +189,11 @@ class IbisWriter:
         #self._print_keyword(f, "Model_type", self._model_type_str(model.modelType))
 
         # Always print Polarity (default: Non-Inverting)
-        polarity_str = {CS.MODEL_POLARITY_NON_INVERTING: "Non-Inverting", CS.MODEL_POLARITY_INVERTING: "Inverting"}.get(
-            model.polarity, "Non-Inverting")
+        polarity_str = self._POLARITY_NAMES.get(model.polarity, "Non-Inverting")
         self._print_keyword(f, "Polarity", polarity_str)
 
         # Always print Enable (default: Active-High)
-        enable_str = {CS.MODEL_ENABLE_ACTIVE_HIGH: "Active-High", CS.MODEL_ENABLE_ACTIVE_LOW: "Active-Low"}.get(
-            model.enable, "Active-High")
+        enable_str = self._ENABLE_NAMES.get(model.enable, "Active-High")
         self._print_keyword(f, "Enable", enable_str)
 
         if not self._is_na(model.Vinl.typ):
@@ -217,11 +253,12 @@ class IbisWriter:
             return
         f.write(f"{keyword}\n")
         f.write("| Voltage     I(typ)        I(min)        I(max)\n")
+        fmt = self._fmt_float
+        rows = []
         for entry in table.VIs:
-            f.write(f"{self._fmt_float(entry.v):>8}  "
-                    f"{self._fmt_float(entry.i.typ):>12}  "
-                    f"{self._fmt_float(entry.i.min):>12}  "
-                    f"{self._fmt_float(entry.i.max):>12}\n")
+            i = entry.i
+            rows.append(_VI_ROW(fmt(entry.v), fmt(i.typ), fmt(i.min), fmt(i.max)))
+        f.write("".join(rows))
         f.write("\n")
 
     def _print_clamp_table(self, f, keyword: str, table: Optional[IbisVItable], tol: float) -> None:
@@ -229,15 +266,15 @@ class IbisWriter:
             return
         f.write(f"{keyword}\n")
         f.write("| Voltage     I(typ)        I(min)        I(max)\n")
+        fmt = self._fmt_float
+        rows = []
         for entry in table.VIs:
             i = entry.i
             if abs(i.typ) < tol: i.typ = 0
             if abs(i.min) < tol: i.min = 0
             if abs(i.max) < tol: i.max = 0
-            f.write(f"{self._fmt_float(entry.v):>8}  "
-                    f"{self._fmt_float(i.typ):>12}  "
-                    f"{self._fmt_float(i.min):>12}  "
-                    f"{self._fmt_float(i.max):>12}\n")
+            rows.append(_VI_ROW(fmt(entry.v), fmt(i.typ), fmt(i.min), fmt(i.max)))
+        f.write("".join(rows))
         f.write("\n")
 
     def _print_ramp(self, f, ramp, model_rload: float) -> None:
@@ -291,9 +328,9 @@ class IbisWriter:
         f.write(f"[{direction} Waveform]\n")
         f.write(f"R_fixture = {wave.R_fixture:.4g}\n")
         f.write(f"V_fixture = {wave.V_fixture:.4g}\n")
-        if wave.V_fixture_min is not None and not math.isnan(wave.V_fixture_min):
+        if wave.V_fixture_min is not None and wave.V_fixture_min == wave.V_fixture_min:
             f.write(f"V_fixture_min = {wave.V_fixture_min:.4g}\n")
-        if wave.V_fixture_max is not None and not math.isnan(wave.V_fixture_max):
+        if wave.V_fixture_max is not None and wave.V_fixture_max == wave.V_fixture_max:
             f.write(f"V_fixture_max = {wave.V_fixture_max:.4g}\n")
 
         # === Java-Exact Table Header ===
@@ -309,17 +346,14 @@ class IbisWriter:
         )
 
         # === Data Rows — Exact Java Format ===
+        rows = []
         for pt in wave.waveData:
-            # Time: in ns, 4 decimal places, 'n' suffix, right-aligned to 15 chars
-            t_str = f"{pt.t * 1e9:.4f}n"
-            t_str = t_str.rjust(15)
-
-            # Voltages: up to 10 significant digits, right-aligned to 15 chars
-            v_typ = f"{pt.v.typ:.10g}".rjust(15)
-            v_min = f"{pt.v.min:.10g}".rjust(15)
-            v_max = f"{pt.v.max:.10g}".rjust(15)
-
-            f.write(f"{t_str}  {v_typ}  {v_min}  {v_max}\n")
+            # Time: in ns, 4 decimal places, 'n' suffix; voltages: up to 10 significant
+            # digits; all columns right-aligned to 15 chars
+            v = pt.v
+            rows.append(_WAVE_ROW(f"{pt.t * 1e9:.4f}n",
+                                  format(v.typ, ".10g"), format(v.min, ".10g"), format(v.max, ".10g")))
+        f.write("".join(rows))
 
         f.write("\n")
 
@@ -328,9 +362,9 @@ class IbisWriter:
         if not wave.waveData:
             return
 
-        # Check if any current data exists
+        # Check if any current data exists (NaN is the only value not equal to itself)
         has_current = any(
-            not math.isnan(pt.i.typ) or not math.isnan(pt.i.min) or not math.isnan(pt.i.max)
+            pt.i.typ == pt.i.typ or pt.i.min == pt.i.min or pt.i.max == pt.i.max
             for pt in wave.waveData
         )
         if not has_current:
@@ -343,17 +377,14 @@ class IbisWriter:
         f.write("|time             I(typ)              I(min)              I(max)\n")
 
         # === Data Rows — Same format as voltage waveform ===
+        fmt = self._fmt_float
+        rows = []
         for pt in wave.waveData:
             # Time: in ns, 4 decimal places, 'n' suffix, right-aligned to 15 chars
-            t_str = f"{pt.t * 1e9:.4f}n"
-            t_str = t_str.rjust(15)
-
             # Currents: use _fmt_float for SI formatting (Amperes → will auto-format as mA with 'm' suffix)
-            i_typ = self._fmt_float(pt.i.typ, "A").rjust(15)
-            i_min = self._fmt_float(pt.i.min, "A").rjust(15)
-            i_max = self._fmt_float(pt.i.max, "A").rjust(15)
-
-            f.write(f"{t_str}  {i_typ}  {i_min}  {i_max}\n")
+            i = pt.i
+            rows.append(_WAVE_ROW(f"{pt.t * 1e9:.4f}n", fmt(i.typ, "A"), fmt(i.min, "A"), fmt(i.max, "A")))
+        f.write("".join(rows))
 
         f.write("\n")
 
@@ -460,43 +491,32 @@ class IbisWriter:
         f.write("| variable    typ          min          max\n")
 
     def _fmt_tmm(self, tmm: Optional[IbisTypMinMax], unit: str) -> str:
-        if not tmm or self._is_na_tmm(tmm):
+        if not tmm:
+            return "NA NA NA"
+        # Test each corner once; typ-only values (min/max NA) skip the SI formatter entirely
+        is_na = self._is_na
+        typ_na, min_na, max_na = is_na(tmm.typ), is_na(tmm.min), is_na(tmm.max)
+        if typ_na and min_na and max_na:
             return "NA NA NA"
-        return f"{self._si(tmm.typ, unit)} {self._si(tmm.min, unit)} {self._si(tmm.max, unit)}"
+        si = self._si
+        typ_s = "NA" if typ_na else si(tmm.typ, unit)
+        if min_na and max_na:
+            return f"{typ_s} NA NA"
+        return f"{typ_s} {'NA' if min_na else si(tmm.min, unit)} {'NA' if max_na else si(tmm.max, unit)}"
 
     def _si(self, val, unit: str) -> str:
         if self._is_na(val):
             return "NA"
         val = float(val)
+        # Ohms are printed bare; every other unit is appended verbatim
+        unit_str = "" if unit == "Ohm" else unit
 
-        # CRITICAL: START FROM LARGEST SCALE → SMALLEST
-        suffixes = [
-            ("M", 1e6), ("k", 1e3), ("", 1),
-            ("m", 1e-3), ("u", 1e-6), ("n", 1e-9), ("p", 1e-12)
-        ]
-
-        for suffix, scale in suffixes:
+        for suffix, scale in _SI_SCALES:
             scaled = val / scale
             if 0.1 <= abs(scaled) < 1000:
-                formatted = f"{scaled:.4f}{suffix}"
-                if unit == "Ohm":
-                    return formatted
-                elif unit == "H":
-                    return f"{formatted}H"
-                elif unit == "F":
-                    return f"{formatted}F"
-                else:
-                    return f"{formatted}{unit}"
-
-        fallback = f"{val:.4g}"
-        if unit == "Ohm":
-            return fallback
-        elif unit == "H":
-            return f"{fallback}H"
-        elif unit == "F":
-            return f"{fallback}F"
-        else:
-            return f"{fallback}{unit}"
+                return f"{scaled:.4f}{suffix}{unit_str}"
+
+        return f"{val:.4g}{unit_str}"
 
     def _fmt_float(self, val, unit: str = "") -> str:
         return self._si(val, unit) if not self._is_na(val) else "NA"
@@ -518,31 +538,17 @@ class IbisWriter:
 
         # 2. If it's an integer (enum) → map to official string
         if isinstance(mt, int):
-            mapping = {
-                CS.ModelType.INPUT: "Input",
-                CS.ModelType.OUTPUT: "Output",
-                CS.ModelType.IO: "I/O",
-                CS.ModelType.THREE_STATE: "3-state",
-                CS.ModelType.OPEN_DRAIN: "Open_drain",
-                CS.ModelType.OPEN_SINK: "Open_sink",
-                CS.ModelType.OPEN_SOURCE: "Open_source",
-                CS.ModelType.IO_OPEN_DRAIN: "I/O_Open_drain",
-                CS.ModelType.IO_OPEN_SINK: "I/O_Open_sink",
-                CS.ModelType.IO_OPEN_SOURCE: "I/O_Open_source",
-                CS.ModelType.SERIES: "Series",
-                CS.ModelType.SERIES_SWITCH: "Series_switch",
-                CS.ModelType.TERMINATOR: "Terminator",
-                CS.ModelType.INPUT_ECL: "Input_ECL",
-                CS.ModelType.OUTPUT_ECL: "Output_ECL",
-                CS.ModelType.IO_ECL: "I/O_ECL",
-            }
-            return mapping.get(mt, "I/O")  # safe default
+            return self._MODEL_TYPE_NAMES.get(mt, "I/O")  # safe default
 
         # 3. Anything else (None, garbage) → spec-compliant default
         return "I/O"
 
     def _is_na(self, x) -> bool:
-        return x is None or (isinstance(x, float) and (math.isnan(x) or x == CS.USE_NA or x == CS.NOT_USED))
+        # CS.USE_NA is NaN, so the self-inequality test covers it; NOT_USED is a finite sentinel
+        return x is None or x != x or x == CS.NOT_USED
 
     def _is_na_tmm(self, tmm: Optional[IbisTypMinMax]) -> bool:
-        return not tmm or all(self._is_na(getattr(tmm, c)) for c in ('typ', 'min', 'max'))
\ No newline at end of file
+        if not tmm:
+            return True
+        is_na = self._is_na
+        return is_na(tmm.typ) and is_na(tmm.min) and is_na(tmm.max)
\ No newline at end of file
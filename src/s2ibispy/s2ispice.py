@@ -15,6 +15,35 @@ from s2ibispy.s2i_constants import ConstantStuff as CS
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 TEST_DIR = os.path.join(PROJECT_ROOT, "tests")
 
+# A line holding exactly two numbers (a SPICE data row), anywhere in a text
+_NUMERIC_ROW_RE = re.compile(
+    r"^[^\S\n]*[+-]?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?[^\S\n]+[+-]?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?[^\S\n]*$",
+    re.MULTILINE,
+)
+
+
+def _read_lines(path: str) -> List[str]:
+    """
+    Slurp a SPICE output file with one os.read() per fstat-sized chunk and split
+    it into lines (universal newlines, no line terminators).
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        chunks = []
+        while True:
+            chunk = os.read(fd, max(size, 65536))
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    text = b"".join(chunks).decode("utf-8", errors="ignore")
+    lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    if lines and not lines[-1]:
+        lines.pop()
+    return lines
+
 @dataclass
 class SpiceVT:
     t: float = 0.0
@@ -254,21 +283,21 @@ class S2ISpice:
     def _write_spice_file_filtered(self, in_path: str, out_f) -> None:
         """Copy a SPICE netlist to out_f, skipping full-line comments (*) and .end lines."""
         with open(in_path, "r") as sf:
-            for raw in sf:
-                line = raw.rstrip("\n")
-                # Tokenize only the first token
-                tok = None
-                for part in line.split():
-                    tok = part
-                    break
-                if tok is None:
-                    # empty line is fine
-                    out_f.write(line + "\n")
-                    continue
+            lines = sf.read().split("\n")
+        if lines and not lines[-1]:
+            lines.pop()
+        kept = []
+        for line in lines:
+            # Tokenize only the first token
+            parts = line.split(None, 1)
+            if parts:
+                tok = parts[0]
                 if tok.startswith("*") or tok.lower() == ".end":
                     # skip comments and .end from DUT
                     continue
-                out_f.write(line + "\n")
+            # empty line is fine
+            kept.append(line + "\n")
+        out_f.write("".join(kept))
 
     def _spice_options(self) -> str:
         # minimal, safe defaults; extend as needed
@@ -780,15 +809,50 @@ class S2ISpice:
     def _file_contains_marker(self, path: str, marker: str) -> bool:
         if not path or not os.path.exists(path) or not marker:
             return False
+        if marker.lower() in self._read_lower(path):
+            logging.debug(f"Found marker '{marker}' in {path}")
+            return True
+        return False
+
+    def _read_lower(self, path: str) -> str:
+        """Whole file lower-cased ('' if missing or unreadable)."""
+        if not path or not os.path.exists(path):
+            return ""
         try:
-            with open(path, "r", encoding="utf-8", errors="ignore") as f:
-                for line in f:
-                    if marker.lower() in line.lower():
-                        logging.debug(f"Found marker '{marker}' in {path}")
-                        return True
+            return "\n".join(_read_lines(path)).lower()
         except Exception as e:
             logging.warning(f"Error reading {path}: {e}")
-        return False
+            return ""
+
+    def _scan_run_logs(self, spice_out: str, spice_msg: str) -> Tuple[bool, bool, str]:
+        """
+        Read a finished run's .out/.msg once and test every abort and
+        non-convergence marker against them (same rules as check_for_abort /
+        check_for_convergence plus generic wording).
+        Returns (aborted, nonconv, lower-cased .out text).
+        """
+        out_text = self._read_lower(spice_out)
+        msg_text = self._read_lower(spice_msg)
+
+        abort_marker = CS.abortMarker.get(self.spice_type, "").lower()
+        if abort_marker and abort_marker in out_text:
+            logging.error(f"Abort detected in {spice_out}")
+            aborted = True
+        elif abort_marker and self.spice_type != CS.SpiceType.ELDO and abort_marker in msg_text:
+            logging.error(f"Abort detected in {spice_msg}")
+            aborted = True
+        else:
+            aborted = "abort" in out_text or "abort" in msg_text
+
+        conv_marker = CS.convergenceMarker.get(self.spice_type, "").lower()
+        if conv_marker and conv_marker in out_text:
+            logging.error(f"Non-convergence detected in {spice_out}")
+            nonconv = True
+        else:
+            needles = ("non convergence", "non-convergence", "nonconvergence")
+            nonconv = any(n in out_text or n in msg_text for n in needles)
+
+        return aborted, nonconv, out_text
 
     def check_for_abort(self, spice_out: str, spice_msg: str) -> int:
         """Return 1 if an abort marker is found (Java parity), else 0."""
@@ -934,8 +998,7 @@ class S2ISpice:
             return 1
 
         try:
-            with open(target_file, "r", encoding="utf-8", errors="ignore") as f:
-                lines = f.readlines()
+            lines = _read_lines(target_file)
         except Exception as e:
             logging.error(f"Error reading {target_file}: {e}")
             return 1
@@ -952,9 +1015,10 @@ class S2ISpice:
         is_eldo = (self.spice_type == CS.SpiceType.ELDO)
 
         # === STEP 1: Find data begin marker ===
+        marker_lower = marker.lower()
         while i < len(lines):
             line = lines[i].strip()
-            if marker.lower() in line.lower():
+            if marker_lower in line.lower():
                 logging.debug(f"Found marker '{marker}' in {target_file}: {line}")
                 i += 1
                 data_start = True
@@ -992,46 +1056,43 @@ class S2ISpice:
                 continue  # skip header
 
         # === STEP 4: Parse data rows ===
-        while i < len(lines) and row < table_size:
-            raw_line = lines[i].rstrip()
+        # ISSO curves measure current in opposite direction:
+        # - Regular pullup/pulldown: negate HSPICE output (current OUT of DUT)
+        # - ISSO_PU/ISSO_PD: keep sign as-is (current already correct)
+        negate = curve_type not in (CS.CurveType.ISSO_PULLUP, CS.CurveType.ISSO_PULLDOWN)
+        corner = command if command in ("typ", "min", "max") else None
+        set_v = (command == "typ")
+        row_match = CS.VI_ROW_RE.match
+        vis = vi_cont.VIs
+        n_lines = len(lines)
+        while i < n_lines and row < table_size:
+            raw_line = lines[i]
             i += 1
             line = raw_line.strip()
-            if not line or line.lower() in ['x', 'vouts2i']:
+            if not line or line.lower() in ('x', 'vouts2i'):
                 continue
 
             # === Extract V and I using VI_ROW_RE ===
-            m = CS.VI_ROW_RE.match(line)
+            m = row_match(line)
             if not m:
-                #logging.debug(f"Skipping non-matching line: {raw_line}")
                 continue
 
             try:
                 v_val = float(m.group(1))
-                i_raw = float(m.group(2))
-                
-                # ISSO curves measure current in opposite direction:
-                # - Regular pullup/pulldown: negate HSPICE output (current OUT of DUT)
-                # - ISSO_PU/ISSO_PD: keep sign as-is (current already correct)
-                if curve_type in [CS.CurveType.ISSO_PULLUP, CS.CurveType.ISSO_PULLDOWN]:
-                    i_val = i_raw  # ISSO: don't negate
-                else:
-                    i_val = -i_raw  # Regular: negate (current into DUT)
+                i_val = float(m.group(2))
             except ValueError:
-                logging.debug(f"Failed to parse numbers: {raw_line}")
+                logging.debug(f"Failed to parse numbers: {raw_line.rstrip()}")
                 continue
+            if negate:
+                i_val = -i_val
 
-            #logging.debug(f"Extracted: v={v_val:.6e}, i={i_val:.6e} from: {raw_line}")
-
-            #vi_cont.VIs[row].v = v_val
-            if command == "typ":
-                vi_cont.VIs[row].v = v_val
-                vi_cont.VIs[row].i.typ = i_val
-            elif command == "min":
-                vi_cont.VIs[row].i.min = i_val
-            elif command == "max":
-                vi_cont.VIs[row].i.max = i_val
-            else:
+            if corner is None:
                 logging.warning(f"Unknown corner '{command}'")
+            else:
+                entry = vis[row]
+                if set_v:
+                    entry.v = v_val
+                setattr(entry.i, corner, i_val)
             row += 1
 
         vi_cont.size = max(vi_cont.size, row)
@@ -1063,8 +1124,7 @@ class S2ISpice:
             return 1
 
         try:
-            with open(target_file, "r") as f:
-                lines = f.readlines()
+            lines = _read_lines(target_file)
 
             tran_hdr = CS.tranDataBeginMarker.get(self.spice_type, "")
             eldo_vi_hdr = CS.VIDataBeginMarker.get(self.spice_type, "")
@@ -1079,7 +1139,8 @@ class S2ISpice:
                 
                 # Look for transient data header (e.g., "time         voltage")
                 if not in_tran_section:
-                    if 'time' in line.lower() and 'voltage' in line.lower():
+                    lower = line.lower()
+                    if 'time' in lower and 'voltage' in lower:
                         in_tran_section = True
                         logging.debug(f"Found transient header at line {i}: {line}")
                         continue
@@ -1204,13 +1265,13 @@ class S2ISpice:
         bin_time = sim_time / (max_bins - 1)
 
         try:
-            with open(spice_out, 'r') as f:
-                lines = f.readlines()
+            lines = _read_lines(spice_out)
 
             # Find data start
             data_start = False
             for i, line in enumerate(lines):
-                if 'time' in line.lower() and any(x in line.lower() for x in ['v(', 'voltage', 'out']):
+                lower = line.lower()
+                if 'time' in lower and ('v(' in lower or 'voltage' in lower or 'out' in lower):
                     data_start = True
                     header_line = i
                     break
@@ -1249,7 +1310,8 @@ class S2ISpice:
             # === BINNING ===
             bin_param = [0, 0, 0.0, 0, 0.0, 0]  # last_bin, interp_bin, v_sum, v_count, i_sum, i_count
             for t, v, i_supply in t_v_pairs:
-                self._bin_tran_data_java(t, v, i_supply, sim_time, bin_time, command, bin_param, wave_p)
+                self._bin_tran_data_java(t, v, i_supply, sim_time, bin_time, command, bin_param, wave_p,
+                                         max_bins=max_bins)
 
             # === FORCE LAST BIN TO EXACT sim_time (JAVA EXACT) ===
             if bin_param[3] > 0:
@@ -1269,7 +1331,7 @@ class S2ISpice:
 
     def _bin_tran_data_java(
             self, t: float, v: float, i_supply: float, sim_time: float, bin_time: float,
-            command: str, bin_param: list, wave_p: IbisWaveTable
+            command: str, bin_param: list, wave_p: IbisWaveTable, max_bins: Optional[int] = None
     ) -> None:
         """
         EXACT port of Java binTranData using list:
@@ -1278,7 +1340,8 @@ class S2ISpice:
         if bin_time <= 0:
             return
 
-        max_bins = getattr(self, 'max_wave_points', CS.WAVE_POINTS_DEFAULT) or CS.WAVE_POINTS_DEFAULT
+        if max_bins is None:
+            max_bins = getattr(self, 'max_wave_points', CS.WAVE_POINTS_DEFAULT) or CS.WAVE_POINTS_DEFAULT
         current_bin = min(math.ceil(t / bin_time), max_bins - 1)
 
         #logging.debug(f"[BIN] t={t:.4e} v={v:.4e} current_bin={current_bin}")
@@ -1298,25 +1361,30 @@ class S2ISpice:
             v_avg = bin_param[2] / bin_param[3]
             i_avg = bin_param[4] / bin_param[5] if bin_param[5] > 0 else 0.0
             t_bin = last_bin * bin_time
-            wave_p.waveData[last_bin].t = t_bin
-            setattr(wave_p.waveData[last_bin].v, command, v_avg)
-            setattr(wave_p.waveData[last_bin].i, command, i_avg)
+            data = wave_p.waveData
+            closed = data[last_bin]
+            closed.t = t_bin
+            setattr(closed.v, command, v_avg)
+            setattr(closed.i, command, i_avg)
             #logging.debug(f"[BIN] Closed bin {last_bin}: t={t_bin:.4e} v_avg={v_avg:.4e} i_avg={i_avg:.4e} ({command})")
 
             # Interpolate skipped bins (linear)
             interp_bin = bin_param[1]
             if last_bin > interp_bin + 1:
-                t_start = wave_p.waveData[interp_bin].t
-                v_start = getattr(wave_p.waveData[interp_bin].v, command)
-                i_start = getattr(wave_p.waveData[interp_bin].i, command)
+                start = data[interp_bin]
+                t_start = start.t
+                v_start = getattr(start.v, command)
+                i_start = getattr(start.i, command)
+                t_span = t_bin - t_start
+                v_span = v_avg - v_start
+                i_span = i_avg - i_start
                 for i in range(interp_bin + 1, last_bin):
                     t_interp = i * bin_time
-                    frac = (t_interp - t_start) / (t_bin - t_start)
-                    v_interp = v_start + frac * (v_avg - v_start)
-                    i_interp = i_start + frac * (i_avg - i_start)
-                    wave_p.waveData[i].t = t_interp
-                    setattr(wave_p.waveData[i].v, command, v_interp)
-                    setattr(wave_p.waveData[i].i, command, i_interp)
+                    frac = (t_interp - t_start) / t_span
+                    entry = data[i]
+                    entry.t = t_interp
+                    setattr(entry.v, command, v_start + frac * v_span)
+                    setattr(entry.i, command, i_start + frac * i_span)
                     #logging.debug(f"[BIN] Interpolated bin {i}: t={t_interp:.4e} v_interp={v_interp:.4e} i_interp={i_interp:.4e} ({command})")
 
             bin_param[1] = last_bin  # interp_bin = last_bin
@@ -1531,42 +1599,9 @@ class S2ISpice:
 
             _ = self.call_spice(iterate, spice_command, spice_in, spice_out, spice_msg)
 
-            def _contains(path: str, needles: list[str]) -> bool:
-                try:
-                    if os.path.exists(path):
-                        with open(path, "r", encoding="utf-8", errors="ignore") as f:
-                            text = f.read().lower()
-                            return any(n in text for n in needles)
-                except Exception:
-                    pass
-                return False
-
-            _num_line = re.compile(r"\s*[+-]?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?\s+[+-]?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?\s*$")
+            aborted, nonconv, out_text = self._scan_run_logs(spice_out, spice_msg)
 
-            def _has_numeric_rows(path: str) -> bool:
-                try:
-                    if os.path.exists(path):
-                        with open(path, "r", encoding="utf-8", errors="ignore") as f:
-                            for ln in f:
-                                if _num_line.match(ln.strip()):
-                                    return True
-                except Exception:
-                    pass
-                return False
-
-            aborted = (
-                    self.check_for_abort(spice_out, spice_msg) == 1
-                    or _contains(spice_out, ["abort", "aborted"])
-                    or _contains(spice_msg, ["abort", "aborted", "simulation aborted"])
-            )
-
-            nonconv = (
-                    self.check_for_convergence(spice_out) == 1
-                    or _contains(spice_out, ["non convergence", "non-convergence", "nonconvergence"])
-                    or _contains(spice_msg, ["non convergence", "non-convergence", "nonconvergence"])
-            )
-
-            if aborted and not nonconv and not _has_numeric_rows(spice_out):
+            if aborted and not nonconv and not _NUMERIC_ROW_RE.search(out_text):
                 nonconv = True
 
             if aborted and nonconv:
@@ -1799,14 +1834,16 @@ class S2ISpice:
 
         # === REBUILD WAVES LIST WITH R_fixture and V_fixture FROM INPUT ===
         waves = []
+        max_points = getattr(self, 'max_wave_points', CS.WAVE_POINTS_DEFAULT) or CS.WAVE_POINTS_DEFAULT
         for input_wave in input_waves:
             wave = IbisWaveTable(
                 R_fixture=input_wave.R_fixture,
                 V_fixture=input_wave.V_fixture  # SINGLE VALUE
             )
+            # Each entry owns its own IbisTypMinMax; the readers fill them in place.
             wave.waveData = [
                 IbisWaveTableEntry(t=0.0, v=IbisTypMinMax(0, 0, 0))
-                for _ in range(getattr(self, 'max_wave_points', CS.WAVE_POINTS_DEFAULT) or CS.WAVE_POINTS_DEFAULT)
+                for _ in range(max_points)
             ]
             waves.append(wave)
             if curve_type == CS.CurveType.RISING_WAVE:
@@ -1814,14 +1851,6 @@ class S2ISpice:
             else:
                 model.fallingWaveList.append(wave)
 
-        # === INITIALIZE waveData ONCE PER WAVE (CRITICAL FIX) ===
-        # === INITIALIZE waveData WITH REAL OBJECTS ===
-        for wave in waves:
-            wave.waveData = [
-                IbisWaveTableEntry(t=0.0, v=IbisTypMinMax(0, 0, 0))
-                for _ in range(getattr(self, 'max_wave_points', CS.WAVE_POINTS_DEFAULT) or CS.WAVE_POINTS_DEFAULT)
-            ]
-
         output_state = CS.OUTPUT_RISING if curve_type == CS.CurveType.RISING_WAVE else CS.OUTPUT_FALLING
 
         res_total = 0